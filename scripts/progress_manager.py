@@ -4,11 +4,30 @@ Progress Manager for multi-level scraping with tqdm
 Manages main and nested sub-progress bars with precise ETA calculations
 """
 
+import array
+import sys
+import threading
 import time
-from datetime import datetime
-from typing import Optional, Dict, Any
-from tqdm import tqdm
-from contextlib import contextmanager
+from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _format_seconds(seconds: int) -> str:
+    """
+    Formats a whole number of seconds (memoized, ETAs repeat the same values)
+    """
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        minutes = seconds // 60
+        remaining_seconds = seconds % 60
+        return f"{minutes}m {remaining_seconds}s" if remaining_seconds > 0 else f"{minutes}m"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
 
 
 class ProgressManager:
@@ -17,105 +36,304 @@ class ProgressManager:
     Uses tqdm for truly nested bars with positioning
     """
     
-    def __init__(self, description: str = ""):
+    # Minimal bar layout: ETAs come from calculate_eta, so tqdm's own
+    # rate/remaining fields are not rendered
+    BAR_FORMAT = "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}{postfix}]"
+    
+    # Remaining-work keys, the delay_stats entry weighting each of them and
+    # the default delays, index-aligned
+    _WORK_KEYS = ('pages', 'questions', 'exams', 'images')
+    _DELAY_KEYS = ('page_scraping', 'question_scraping', 'exam_pause', 'image_download')
+    _DELAYS = (
+        3.0,   # 2-4s between ServiceNow pages
+        7.5,   # 5-10s between questions
+        15.0,  # 15s between exams
+        0.5    # 0.5s per image
+    )
+    
+    # delay_stats entry used as the default per-item time for each phase
+    _PHASE_TO_DELAY_KEY = {
+        'link_collection': 'page_scraping',
+        'question_processing': 'question_scraping'
+    }
+    
+    # Display labels derived from stat keys, shared by all instances
+    _LABEL_CACHE = {}
+    
+    def __init__(self, description: str = "", delay_stats: Optional[Dict[str, float]] = None):
         self.description = description
         self.main_bar = None
         self.current_sub_bar = None
+        self._sub_pool = None  # Single sub-bar reused across phases
+        self.update_sub = self._update_sub_noop
         self.current_main_step = 0
         self.total_main_steps = 0
         
+        # Refresh throttling (avoids flushing stdout on every fast item)
+        self.refresh_interval = 0.1
+        
+        # Redirected output (CI, cron, log files): bars are disabled and the
+        # sub-phase progress is logged every N items or every few seconds
+        self._is_tty = sys.stderr.isatty()
+        self.log_every_items = 25
+        self.log_every_seconds = 10.0
+        self._sub_title = ""
+        self._sub_done = 0
+        self._sub_logged_at = 0.0
+        
         # Timing and ETA
         self.start_time = None
-        self.phase_timings = {}
+        self.phase_timings = {}  # Latest duration per phase type
         self.current_phase = None
         
+        # Every recorded phase run, as parallel compact arrays
+        self._phase_names = []
+        self._phase_durations = array.array('f')
+        
+        # Per-item time estimates (exponential moving average per phase)
+        self.ema_alpha = 0.2
+        self._phase_ema = {}
+        self._last_item_ts = None
+        
         # Bar positions (tqdm support)
         self.main_position = 0  # Main bar always at position 0
         self.sub_position = 1   # Sub-bars at position 1
         
-        # Average delay statistics (based on existing code analysis)
-        self.delay_stats = {
-            'page_scraping': 3.0,  # 2-4s between ServiceNow pages
-            'question_scraping': 7.5,  # 5-10s between questions
-            'exam_pause': 15.0,  # 15s between exams
-            'image_download': 0.5  # 0.5s per image
-        }
+        # Average delay statistics (based on existing code analysis); kept as
+        # a mutable dict so callers can tune it
+        self.delay_stats = dict(zip(self._DELAY_KEYS, self._DELAYS))
+        if delay_stats:
+            # Floors can be lowered when requests run concurrently; observed
+            # per-phase timings then take over in calculate_phase_eta
+            self.delay_stats.update(delay_stats)
+        
+        # Bounded LRU cache of formatted ETAs (remaining work changes slowly)
+        self._eta_cache = OrderedDict()
+        self._eta_cache_size = 256
+        
+        # Log timestamp cached with one-second granularity
+        self._ts_epoch = None
+        self._ts_str = ""
     
-    @contextmanager
-    def main_progress(self, total_steps: int, title: str = None):
+    def main_progress(self, total_steps: int, title: str = None) -> "_MainProgress":
         """
         Context manager for main progress bar (stays visible)
         """
+        from tqdm import tqdm  # Deferred: only paid once a bar is actually used
+        return _MainProgress(self, tqdm, total_steps, title)
+    
+    def sub_progress(self, total_items: int, title: str, phase_type: str = None) -> "_SubProgress":
+        """
+        Context manager for sub-progress bars (temporary)
+        """
+        from tqdm import tqdm
+        return _SubProgress(self, tqdm, total_items, title, phase_type)
+    
+    def async_main_progress(self, total_steps: int, title: str = None) -> "_MainProgress":
+        """
+        Async variant of main_progress for use inside coroutines
+        """
+        from tqdm.asyncio import tqdm as tqdm_asyncio
+        return _MainProgress(self, tqdm_asyncio, total_steps, title)
+    
+    def async_sub_progress(self, total_items: int, title: str, phase_type: str = None) -> "_SubProgress":
+        """
+        Async variant of sub_progress for use inside coroutines
+        """
+        from tqdm.asyncio import tqdm as tqdm_asyncio
+        return _SubProgress(self, tqdm_asyncio, total_items, title, phase_type)
+    
+    def _start_main(self, total_steps: int, title: Optional[str]) -> Dict[str, Any]:
+        """
+        Resets main step tracking and returns the main bar tqdm options
+        """
         self.total_main_steps = total_steps
         self.current_main_step = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         display_title = title or self.description
         
-        with tqdm(
+        return dict(
             total=total_steps,
             desc=f"🚀 {display_title}",
             position=self.main_position,
             leave=True,  # Main bar stays visible
             unit="step",
-            colour="green"
-        ) as bar:
-            self.main_bar = bar
-            try:
-                yield self
-            finally:
-                self.main_bar = None
+            colour="green",
+            mininterval=self.refresh_interval,
+            miniters=1,
+            smoothing=0.1,
+            dynamic_ncols=True,
+            bar_format=self.BAR_FORMAT,
+            disable=not self._is_tty
+        )
     
-    @contextmanager 
-    def sub_progress(self, total_items: int, title: str, phase_type: str = None):
+    def _start_sub(self, phase_type: Optional[str]) -> float:
         """
-        Context manager for sub-progress bars (temporary)
+        Marks the start of a sub-phase and returns its start time
         """
         self.current_phase = phase_type
-        phase_start_time = time.time()
-        
-        with tqdm(
+        phase_start_time = time.monotonic()
+        self._last_item_ts = phase_start_time
+        return phase_start_time
+    
+    def _sub_bar_options(self, total_items: int, title: str) -> Dict[str, Any]:
+        """
+        Returns the sub-bar tqdm options
+        """
+        return dict(
             total=total_items,
             desc=f"📄 {title}",
             position=self.sub_position,
             leave=False,  # Sub-bar disappears at the end
             unit="item",
             colour="blue",
-            ascii=False
-        ) as bar:
-            self.current_sub_bar = bar
-            try:
-                yield self
-            finally:
-                if phase_type:
-                    phase_duration = time.time() - phase_start_time
-                    self.phase_timings[phase_type] = phase_duration
-                self.current_sub_bar = None
-                self.current_phase = None
+            ascii=False,
+            mininterval=self.refresh_interval,
+            miniters=1,
+            smoothing=0.1,
+            dynamic_ncols=True,
+            bar_format=self.BAR_FORMAT,
+            disable=not self._is_tty
+        )
+    
+    def _acquire_sub_bar(self, bar_cls, total_items: int, title: str):
+        """
+        Returns the pooled sub-bar reset for a new phase, creating it on first use
+        """
+        self._sub_title = title
+        self._sub_done = 0
+        self._sub_logged_at = time.monotonic()
+        
+        bar = self._sub_pool
+        if bar is None:
+            bar = self._sub_pool = bar_cls(**self._sub_bar_options(total_items, title))
+        else:
+            bar.set_postfix_str("", refresh=False)
+            bar.set_description(f"📄 {title}", refresh=False)
+            bar.reset(total=total_items)
+        
+        # Empty phases keep ignoring updates, as the old truthiness guard did
+        self.update_sub = self._update_sub_active if bar else self._update_sub_noop
+        return bar
+    
+    def close_sub_bar(self):
+        """
+        Closes the pooled sub-bar (called automatically when main_progress exits)
+        """
+        if self._sub_pool is not None:
+            self._sub_pool.close()
+            self._sub_pool = None
+    
+    def _finish_sub(self, phase_type: Optional[str], phase_start_time: float):
+        """
+        Records the phase duration and clears the sub-bar for reuse
+        """
+        if self.current_sub_bar is not None:
+            self.current_sub_bar.clear()
+        if phase_type:
+            phase_duration = time.monotonic() - phase_start_time
+            self.phase_timings[phase_type] = phase_duration
+            self._phase_names.append(sys.intern(phase_type))
+            self._phase_durations.append(phase_duration)
+        self.current_sub_bar = None
+        self.current_phase = None
+        self.update_sub = self._update_sub_noop
     
     def update_main(self, text: str = ""):
         """
         Updates main bar and moves to next step
         """
+        self.update_main_n(1, text)
+    
+    def update_main_n(self, n: int, text: str = ""):
+        """
+        Advances main bar by n steps at once, logging text a single time
+        """
         if self.main_bar:
-            self.current_main_step += 1
-            self.main_bar.update(1)
+            self.current_main_step += n
+            self.main_bar.update(n)
             
             # Use tqdm.write() to avoid breaking display
             if text:
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                tqdm.write(f"[{timestamp}] {text}")
+                timestamp = self._timestamp()
+                self.write(f"[{timestamp}] {text}")
     
-    def update_sub(self, text: str = ""):
+    # update_sub is bound per instance: _update_sub_active while a sub-bar is
+    # attached, _update_sub_noop otherwise (no guard on the hot path)
+    
+    def _update_sub_active(self, text: str = ""):
         """
         Updates sub-bar
         """
-        if self.current_sub_bar:
-            self.current_sub_bar.update(1)
-            
-            # Update description if provided
+        self._advance_sub(1, text)
+    
+    def _update_sub_noop(self, text: str = ""):
+        """
+        Ignores updates while no sub-bar is attached
+        """
+    
+    def update_sub_n(self, n: int, text: str = ""):
+        """
+        Advances sub-bar by n items at once (e.g., after a batch of concurrent requests)
+        """
+        if self.current_sub_bar and n > 0:
+            self._advance_sub(n, text)
+    
+    def skip_sub(self, n: int, text: str = ""):
+        """
+        Marks n sub-bar items as skipped: the bar is filled, the per-item estimate is left alone
+        """
+        if self.current_sub_bar and n > 0:
             if text:
-                self.current_sub_bar.set_description(f"📄 {text}")
+                self.current_sub_bar.set_postfix_str(text, refresh=False)
+            self.current_sub_bar.update(n)
+            if not self._is_tty:
+                self._log_sub_progress(n, text, time.monotonic())
+    
+    def _advance_sub(self, n: int, text: str):
+        """
+        Advances the attached sub-bar and the phase's per-item estimate
+        """
+        # Postfix is painted by the next (mininterval-throttled) refresh
+        if text:
+            self.current_sub_bar.set_postfix_str(text, refresh=False)
+        self.current_sub_bar.update(n)
+        now = time.monotonic()
+        
+        # Fold the batch's per-item duration into the phase's estimate
+        phase = self.current_phase
+        if phase and self._last_item_ts is not None:
+            dt = (now - self._last_item_ts) / n
+            previous = self._phase_ema.get(phase, dt)
+            self._phase_ema[phase] = self.ema_alpha * dt + (1 - self.ema_alpha) * previous
+        self._last_item_ts = now
+        
+        if not self._is_tty:
+            self._log_sub_progress(n, text, now)
+    
+    def _log_sub_progress(self, n: int, text: str, now: float):
+        """
+        Periodic plain-text progress line used when bars are disabled
+        """
+        previous_done = self._sub_done
+        self._sub_done += n
+        total = self.current_sub_bar.total
+        
+        crossed_step = self._sub_done // self.log_every_items > previous_done // self.log_every_items
+        finished = total is not None and self._sub_done >= total
+        if crossed_step or finished or now - self._sub_logged_at >= self.log_every_seconds:
+            self._sub_logged_at = now
+            suffix = f" - {text}" if text else ""
+            self.write(f"[{self._timestamp()}] 📄 {self._sub_title}: {self._sub_done}/{total}{suffix}")
+    
+    async def update_sub_async(self, text: str = ""):
+        """
+        Updates sub-bar, then yields to the event loop
+        """
+        import asyncio
+        self.update_sub(text)
+        await asyncio.sleep(0)
     
     def calculate_eta(self, remaining_work: Dict[str, int]) -> str:
         """
@@ -131,32 +349,56 @@ class ProgressManager:
         Returns:
             Formatted ETA (e.g., "2m 30s")
         """
-        total_seconds = 0
+        # Delays are part of the key since callers may tune delay_stats
+        weights = self._delay_weights()
+        key = tuple(remaining_work.get(work_key, 0) for work_key in self._WORK_KEYS) + weights
+        
+        cached = self._eta_cache.get(key)
+        if cached is not None:
+            self._eta_cache.move_to_end(key)
+            return cached
         
-        # Calculate based on average delays
-        total_seconds += remaining_work.get('pages', 0) * self.delay_stats['page_scraping']
-        total_seconds += remaining_work.get('questions', 0) * self.delay_stats['question_scraping']
-        total_seconds += remaining_work.get('exams', 0) * self.delay_stats['exam_pause']
-        total_seconds += remaining_work.get('images', 0) * self.delay_stats['image_download']
+        # Calculate based on average delays (dot product of counts and weights)
+        total_seconds = sum(count * weight for count, weight in zip(key, weights))
         
-        return self._format_time(total_seconds)
+        eta = self._format_time(total_seconds)
+        self._eta_cache[key] = eta
+        if len(self._eta_cache) > self._eta_cache_size:
+            self._eta_cache.popitem(last=False)
+        return eta
+    
+    def calculate_eta_batch(self, remaining_works: List[Dict[str, int]]) -> List[str]:
+        """
+        Calculates ETAs for several remaining-work candidates at once
+        (e.g., what-if planning across multiple exams)
+        """
+        weights = self._delay_weights()
+        return [
+            self._format_time(sum(
+                work.get(work_key, 0) * weight
+                for work_key, weight in zip(self._WORK_KEYS, weights)
+            ))
+            for work in remaining_works
+        ]
+    
+    def _delay_weights(self) -> tuple:
+        """
+        Returns delay_stats values in _WORK_KEYS order
+        """
+        return tuple(map(self.delay_stats.__getitem__, self._DELAY_KEYS))
     
     def calculate_phase_eta(self, phase_type: str, items_remaining: int, items_total: int) -> str:
         """
         Calculates ETA for a specific phase based on current performance
+        (moving average of per-item time, updated on every update_sub)
         """
-        if phase_type in self.phase_timings and items_total > 0:
-            # Use observed performance from this session
-            avg_time_per_item = self.phase_timings[phase_type] / (items_total - items_remaining)
-            eta_seconds = avg_time_per_item * items_remaining
-        else:
-            # Use default statistics
-            delay_key = {
-                'link_collection': 'page_scraping',
-                'question_processing': 'question_scraping'
-            }.get(phase_type, 'question_scraping')
-            
-            eta_seconds = items_remaining * self.delay_stats[delay_key]
+        avg_time_per_item = self._phase_ema.get(phase_type)
+        if avg_time_per_item is None:
+            # No observed items yet, use default statistics
+            delay_key = self._PHASE_TO_DELAY_KEY.get(phase_type, 'question_scraping')
+            avg_time_per_item = self.delay_stats[delay_key]
+        
+        eta_seconds = items_remaining * avg_time_per_item
         
         return self._format_time(eta_seconds)
     
@@ -164,54 +406,147 @@ class ProgressManager:
         """
         Formats time in readable format (e.g., "2m 30s", "45s", "1h 15m")
         """
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            remaining_seconds = int(seconds % 60)
-            return f"{minutes}m {remaining_seconds}s" if remaining_seconds > 0 else f"{minutes}m"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            return f"{hours}h {minutes}m" if minutes > 0 else f"{hours}h"
+        # Sub-second precision is discarded anyway, quantize for cache hits
+        return _format_seconds(int(seconds))
     
     def print_phase_summary(self, phase_name: str, **stats):
         """
-        Displays phase summary with statistics (uses tqdm.write)
+        Displays phase summary with statistics (a single tqdm.write)
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        tqdm.write(f"\n[{timestamp}] ✅ {phase_name} completed")
+        timestamp = self._timestamp()
+        lines = [f"\n[{timestamp}] ✅ {phase_name} completed"]
         
         for key, value in stats.items():
             if key.endswith('_count'):
-                label = key.replace('_count', '').replace('_', ' ').title()
-                tqdm.write(f"   📊 {label}: {value}")
+                label = self._label(key, '_count')
+                lines.append(f"   📊 {label}: {value}")
             elif key.endswith('_time'):
-                label = key.replace('_time', '').replace('_', ' ').title()
+                label = self._label(key, '_time')
                 formatted_time = self._format_time(value)
-                tqdm.write(f"   ⏱️  {label}: {formatted_time}")
+                lines.append(f"   ⏱️  {label}: {formatted_time}")
+        
+        self.write("\n".join(lines))
     
     def print_final_summary(self, **stats):
         """
-        Displays final summary with all statistics (uses tqdm.write)
+        Displays final summary with all statistics (a single tqdm.write)
         """
-        if self.start_time:
-            total_time = time.time() - self.start_time
+        if self.start_time is not None:
+            total_time = time.monotonic() - self.start_time
             
-            tqdm.write(f"\n🎉 Scraping completed!")
-            tqdm.write(f"⏱️  Total time: {self._format_time(total_time)}")
+            lines = [f"\n🎉 Scraping completed!", f"⏱️  Total time: {self._format_time(total_time)}"]
             
             for key, value in stats.items():
                 if key.endswith('_count'):
-                    label = key.replace('_count', '').replace('_', ' ').title()
-                    tqdm.write(f"📊 {label}: {value}")
+                    label = self._label(key, '_count')
+                    lines.append(f"📊 {label}: {value}")
+            
+            # Display phase times (summed over every run of each phase)
+            if self._phase_names:
+                phase_totals = {}
+                for phase, duration in zip(self._phase_names, self._phase_durations):
+                    phase_totals[phase] = phase_totals.get(phase, 0.0) + duration
+                
+                lines.append(f"\n📈 Phase details:")
+                for phase, duration in phase_totals.items():
+                    phase_name = self._label(phase)
+                    lines.append(f"   {phase_name}: {self._format_time(duration)}")
             
-            # Display phase times
-            if self.phase_timings:
-                tqdm.write(f"\n📈 Phase details:")
-                for phase, duration in self.phase_timings.items():
-                    phase_name = phase.replace('_', ' ').title()
-                    tqdm.write(f"   {phase_name}: {self._format_time(duration)}")
+            self.write("\n".join(lines))
+    
+    @classmethod
+    def _label(cls, key: str, suffix: str = "") -> str:
+        """
+        Turns a stat key into a display label (e.g., "total_links_count" -> "Total Links")
+        """
+        cache_key = (key, suffix)
+        label = cls._LABEL_CACHE.get(cache_key)
+        if label is None:
+            base = key[:-len(suffix)] if suffix and key.endswith(suffix) else key
+            label = base.replace('_', ' ').title()
+            cls._LABEL_CACHE[cache_key] = label
+        return label
+    
+    def _timestamp(self) -> str:
+        """
+        Returns the current time as HH:MM:SS, recomputed at most once per second
+        """
+        epoch = int(time.time())
+        if epoch != self._ts_epoch:
+            self._ts_epoch = epoch
+            self._ts_str = time.strftime('%H:%M:%S', time.localtime(epoch))
+        return self._ts_str
+    
+    def write(self, line: str):
+        """
+        Writes a log line right away with tqdm.write, so it stays in order with
+        the caller's own print() and tqdm.write() output
+        """
+        from tqdm import tqdm
+        tqdm.write(line)
+
+
+class _MainProgress:
+    """
+    Context manager owning the main bar (sync and async protocols)
+    """
+    
+    def __init__(self, manager: ProgressManager, bar_cls, total_steps: int, title: Optional[str]):
+        self.manager = manager
+        self.bar_cls = bar_cls
+        self.total_steps = total_steps
+        self.title = title
+    
+    def __enter__(self) -> ProgressManager:
+        manager = self.manager
+        manager.main_bar = self.bar_cls(**manager._start_main(self.total_steps, self.title))
+        return manager
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        manager = self.manager
+        try:
+            manager.close_sub_bar()
+        finally:
+            manager.main_bar.close()
+            manager.main_bar = None
+        return False
+    
+    async def __aenter__(self) -> ProgressManager:
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        return self.__exit__(exc_type, exc_value, traceback)
+
+
+class _SubProgress:
+    """
+    Context manager attaching the pooled sub-bar to a phase (sync and async protocols)
+    """
+    
+    def __init__(self, manager: ProgressManager, bar_cls, total_items: int, title: str,
+                 phase_type: Optional[str]):
+        self.manager = manager
+        self.bar_cls = bar_cls
+        self.total_items = total_items
+        self.title = title
+        self.phase_type = phase_type
+        self.phase_start_time = None
+    
+    def __enter__(self) -> ProgressManager:
+        manager = self.manager
+        self.phase_start_time = manager._start_sub(self.phase_type)
+        manager.current_sub_bar = manager._acquire_sub_bar(self.bar_cls, self.total_items, self.title)
+        return manager
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.manager._finish_sub(self.phase_type, self.phase_start_time)
+        return False
+    
+    async def __aenter__(self) -> ProgressManager:
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        return self.__exit__(exc_type, exc_value, traceback)
 
 
 class LegacyProgressAdapter:
@@ -222,11 +557,26 @@ class LegacyProgressAdapter:
     def __init__(self, progress_manager: ProgressManager):
         self.progress_manager = progress_manager
     
-    def progress(self, value: float, text: str = ""):
+    def progress(self, value: Optional[float] = None, text: str = ""):
         """
         Interface compatible with old progress.progress() system
+        (value is accepted for compatibility but ignored)
         """
-        if text:
+        self.progress_manager.update_sub(text)
+
+
+class ThreadSafeProgressAdapter(LegacyProgressAdapter):
+    """
+    Legacy adapter that can be shared by several worker threads
+    """
+    
+    def __init__(self, progress_manager: ProgressManager):
+        super().__init__(progress_manager)
+        self._lock = threading.Lock()
+    
+    def progress(self, value: Optional[float] = None, text: str = ""):
+        """
+        Serialized update of the shared sub-bar
+        """
+        with self._lock:
             self.progress_manager.update_sub(text)
-        else:
-            self.progress_manager.update_sub()
\ No newline at end of file
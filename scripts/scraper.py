@@ -1,18 +1,30 @@
 from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import re
 import json
 import time
+import threading
 import os
 import hashlib
 import random
 import urllib.robotparser
 import base64
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from PIL import Image
 import io
 
+try:
+    # Fast JSON backend; output is byte-identical to json.dump(indent=2, ensure_ascii=False)
+    import orjson
+except ImportError:
+    orjson = None
+
 # Streamlit removed - not needed for automation scripts
 
 # IMPROVEMENTS: Enhanced scraper with smart update logic
@@ -43,21 +55,111 @@ HEADERS = {
         }
 PREFIX = "https://www.examtopics.com/discussions/"
 
-def respectful_request(url, headers=None, timeout=30):
+# Question number in a discussion link
+QUESTION_NUMBER_RE = re.compile(r"question-(\d+)")
+# Runs of whitespace inside answer texts
+WHITESPACE_RE = re.compile(r"\s+")
+
+class RateLimitedRetry(Retry):
     """
-    Make a respectful HTTP request with built-in delays and error handling
+    Retry whose retries also wait for a RATE_LIMITER token: they happen inside
+    session.get, after the caller already went through the limiter once
     """
-    if headers is None:
-        headers = HEADERS
     
+    def sleep(self, response=None):
+        super().sleep(response)
+        RATE_LIMITER.acquire()
+
+def create_session(retry_cls=RateLimitedRetry):
+    """
+    Create a requests session with HTTP keep-alive, a shared connection pool
+    and retries with backoff on transient errors
+    retry_cls: Retry subclass used by the adapter (plain Retry skips the rate limiter)
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=retry_cls(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared by every request of a scraper run so TCP/TLS connections are reused
+SESSION = create_session()
+# Image downloads aren't held to the page rate, their retries neither
+IMAGE_SESSION = create_session(Retry)
+
+class RateLimiter:
+    """
+    Token bucket shared by every thread of a scraper run: on average at most
+    `rate` requests per second, in bursts of at most `burst` requests
+    """
+    
+    def __init__(self, rate=1.0, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Blocks until the next request may be sent (rate <= 0 disables the limit)
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token now, waiting outside the lock keeps callers in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+# Caps the request rate to ExamTopics across concurrent pages and exams
+RATE_LIMITER = RateLimiter(rate=1.0, burst=2)
+
+def respectful_request(url, headers=None, timeout=30, rate_limited=True):
+    """
+    Make a respectful HTTP request with built-in delays and error handling
+    Rate limited by RATE_LIMITER (rate_limited=False for image downloads), 429/5xx
+    responses are retried with backoff (honouring Retry-After) by the session,
+    each retry of a rate limited request taking a RATE_LIMITER token as well
+    """
+    if rate_limited:
+        RATE_LIMITER.acquire()
+        session = SESSION
+    else:
+        session = IMAGE_SESSION
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = session.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
         print(f"Request failed for {url}: {e}")
         return None
 
+def fetch_page_bytes(url, timeout=30):
+    """
+    respectful_request for pages that are only parsed: returns the body bytes,
+    or None on failure
+    The body is read straight from the connection instead of being assembled
+    by requests, and the connection goes back to the pool right away
+    """
+    RATE_LIMITER.acquire()
+    try:
+        with SESSION.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            return response.raw.read(decode_content=True)
+    except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+        print(f"Request failed for {url}: {e}")
+        return None
+
 def check_robots_txt(base_url):
     """
     Check if robots.txt allows scraping of the given URL
@@ -75,18 +177,55 @@ def check_robots_txt(base_url):
 def load_json(json_path):
     if not os.path.exists(json_path):
         return {}
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            try:
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                return {}
     with open(json_path, 'r', encoding='utf-8') as f:
         try:
             return json.load(f)
         except json.JSONDecodeError:
             return {}
+
+@lru_cache(maxsize=256)
+def _load_json_version(json_path, mtime_ns, size):
+    return load_json(json_path)
+
+def load_json_cached(json_path):
+    """
+    load_json for files that are only read: each version of a file (mtime, size)
+    is decoded once, so rewriting the file invalidates it
+    The returned object is shared between callers and must not be mutated
+    """
+    try:
+        stat = os.stat(json_path)
+    except OSError:
+        return {}
+    return _load_json_version(json_path, stat.st_mtime_ns, stat.st_size)
         
 def save_json(file, json_path):
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(file, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    # Serialize first and write once, json.dump issues one small write per token
+    data = json.dumps(file, ensure_ascii=False, indent=2)
     with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(file, f, ensure_ascii=False, indent=2)
+        f.write(data)
+
+def save_json_atomic(file, json_path):
+    """
+    save_json through a temporary file renamed over json_path, so readers
+    never see a partially written file
+    """
+    tmp_path = f"{json_path}.tmp"
+    save_json(file, tmp_path)
+    os.replace(tmp_path, json_path)
 
 def get_exam_category(exam_code):
-    response = requests.get(f"https://www.examtopics.com/search/?query={exam_code}", allow_redirects=True)
+    response = SESSION.get(f"https://www.examtopics.com/search/?query={exam_code}", allow_redirects=True)
     final_url = response.url
     if "/exams/" in final_url:
         parts = final_url.strip("/").split("/")
@@ -135,9 +274,10 @@ def get_question_links(exam_code, progress, json_path, force_rescan=False):
     strong_tags = page_indicator.find_all("strong")
     num_pages = int(strong_tags[1].text)
 
-    links_json = load_json(json_path)
+    links_json = load_json_cached(json_path)
     if links_json and not force_rescan:
-        question_links = links_json.get("links", [])
+        # Own copy, links_json is shared through the cache and must stay untouched
+        question_links = list(links_json.get("links", []))
         page_num = links_json.get("page_num", 1)
         status = links_json.get("status", "in progress")
         if status == "complete":
@@ -177,7 +317,7 @@ def get_question_links(exam_code, progress, json_path, force_rescan=False):
         if i < num_pages:
             delay = random.uniform(2, 5)  # Shorter delay for page navigation
             time.sleep(delay)
-    sorted_links = sorted(question_links, key=lambda link: int(re.search(r'question-(\d+)', link).group(1)))
+    sorted_links = sorted(question_links, key=lambda link: int(QUESTION_NUMBER_RE.search(link).group(1)))
     question_links_obj = {"page_num": i, "status": "complete", "links": sorted_links}
     save_json(question_links_obj, json_path)
     return sorted_links
@@ -202,7 +342,7 @@ def scrape_page(link):
             "error": f"Request or parsing failed: {e}"
         }
 
-    question_number_match = re.search(r"question-(\d+)", link)
+    question_number_match = QUESTION_NUMBER_RE.search(link)
     question_number = question_number_match.group(1) if question_number_match else "unknown"
     
     # Extract and process images from the question
@@ -262,7 +402,7 @@ def scrape_page(link):
             if answers_div:
                 answer_options = answers_div.find_all("li")
                 if answer_options:
-                    answers = [re.sub(r'\s+', ' ', answer_option.text).strip() for answer_option in answer_options]
+                    answers = [WHITESPACE_RE.sub(' ', answer_option.text).strip() for answer_option in answer_options]
     except Exception:
         pass
 
@@ -365,7 +505,28 @@ def needs_update(existing_question, new_question):
     return False, "no changes detected"
 
         
-def scrape_questions(question_links, json_path, progress, rapid_scraping=False, force_update=False):
+def fetch_question_pages(urls, workers=1, rapid_scraping=False):
+    """
+    Scrapes question pages with up to `workers` concurrent requests and yields
+    their question objects in link order
+    Each worker keeps the respectful 5-10s delay after its page unless
+    rapid_scraping, so workers=1 behaves exactly like the serial loop
+    """
+    def fetch(url):
+        question_object = scrape_page(url)
+        if not rapid_scraping:
+            # Random delay between 5-10 seconds to be more respectful and less predictable
+            time.sleep(random.uniform(5, 10))
+        return question_object
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        yield from executor.map(fetch, urls)
+    finally:
+        # Stop fetching pages nobody will read once the caller stops (error)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def scrape_questions(question_links, json_path, progress, rapid_scraping=False, force_update=False, workers=1):
     questions_obj = load_json(json_path)
     if questions_obj:
         questions = questions_obj.get("questions", [])
@@ -383,61 +544,62 @@ def scrape_questions(question_links, json_path, progress, rapid_scraping=False,
     new_count = 0
     skipped_count = 0
     
-    for i, link in enumerate(question_links):
-        question_number_match = re.search(r"question-(\d+)", link)
-        question_number = question_number_match.group(1) if question_number_match else "unknown"
-        
-        # Check if question already exists
-        existing_question = existing_questions_dict.get(question_number)
-        
-        if existing_question and not force_update:
-            # Scrape new version for comparison
-            progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Checking {prefix+link}")
-            new_question = scrape_page(prefix+link)
-            
-            if new_question["error"]:
-                error_string = f"Error: {new_question['error']}"
-                break
-            
-            # Check if update is needed
-            update_needed, reason = needs_update(existing_question, new_question)
-            
-            if update_needed:
-                # Update existing question
-                for j, q in enumerate(questions):
-                    if q["question_number"] == question_number:
-                        questions[j] = new_question
-                        updated_count += 1
-                        progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Updated {prefix+link} ({reason})")
-                        break
-            else:
-                skipped_count += 1
-                progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Skipped {prefix+link} (no changes)")
-        else:
-            # New question or force_update enabled
-            progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Scraping {prefix+link}")
-            question_object = scrape_page(prefix+link)
+    # Pages are fetched ahead by the workers, results are applied here in order
+    question_pages = fetch_question_pages([prefix + link for link in question_links], workers, rapid_scraping)
+    try:
+        for i, (link, scraped_question) in enumerate(zip(question_links, question_pages)):
+            question_number_match = QUESTION_NUMBER_RE.search(link)
+            question_number = question_number_match.group(1) if question_number_match else "unknown"
             
-            if question_object["error"]:
-                error_string = f"Error: {question_object['error']}"
-                break
+            # Check if question already exists
+            existing_question = existing_questions_dict.get(question_number)
             
-            if existing_question:
-                # Replace existing question (force_update)
-                for j, q in enumerate(questions):
-                    if q["question_number"] == question_number:
-                        questions[j] = question_object
-                        updated_count += 1
-                        break
+            if existing_question and not force_update:
+                # Scrape new version for comparison
+                progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Checking {prefix+link}")
+                new_question = scraped_question
+                
+                if new_question["error"]:
+                    error_string = f"Error: {new_question['error']}"
+                    break
+                
+                # Check if update is needed
+                update_needed, reason = needs_update(existing_question, new_question)
+                
+                if update_needed:
+                    # Update existing question
+                    for j, q in enumerate(questions):
+                        if q["question_number"] == question_number:
+                            questions[j] = new_question
+                            updated_count += 1
+                            progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Updated {prefix+link} ({reason})")
+                            break
+                else:
+                    skipped_count += 1
+                    progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Skipped {prefix+link} (no changes)")
             else:
-                # Add new question
-                questions.append(question_object)
-                new_count += 1
-        
-        if not rapid_scraping:
-            # Random delay between 5-10 seconds to be more respectful and less predictable
-            delay = random.uniform(5, 10)
-            time.sleep(delay)
+                # New question or force_update enabled
+                progress.progress((i+1)/(questions_num), text=f"{i+1}/{questions_num} - Scraping {prefix+link}")
+                question_object = scraped_question
+                
+                if question_object["error"]:
+                    error_string = f"Error: {question_object['error']}"
+                    break
+                
+                if existing_question:
+                    # Replace existing question (force_update)
+                    for j, q in enumerate(questions):
+                        if q["question_number"] == question_number:
+                            questions[j] = question_object
+                            updated_count += 1
+                            break
+                else:
+                    # Add new question
+                    questions.append(question_object)
+                    new_count += 1
+    finally:
+        # Also on an error, so the workers stop fetching pages and images
+        question_pages.close()
     
     questions.sort(key=lambda x: int(x["question_number"]) if x["question_number"].isdigit() else float('inf'))
     status = "complete" if len(questions) == questions_num else "in progress"
@@ -467,7 +629,7 @@ def scrape_questions(question_links, json_path, progress, rapid_scraping=False,
 def load_json_from_github(exam_code):
     url = f"https://raw.githubusercontent.com/17Andri17/ExamTopics-Question-Viewer/refs/heads/main/data/{exam_code}.json"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
         questions_obj = json.loads(response.text)
         questions = questions_obj.get("questions", [])
@@ -487,7 +649,7 @@ def get_current_links_count(exam_code, timeout=10):
             return 0
         
         url = f"{PREFIX}{category}/"
-        response = requests.get(url, headers=HEADERS, timeout=timeout)
+        response = SESSION.get(url, timeout=timeout)
         soup = BeautifulSoup(response.content, "html.parser")
         
         # Find number of pages
@@ -508,7 +670,7 @@ def get_current_links_count(exam_code, timeout=10):
         
         for i in range(1, sample_pages + 1):
             page_url = url + f"{i}/"
-            page_response = requests.get(page_url, headers=HEADERS, timeout=timeout)
+            page_response = SESSION.get(page_url, timeout=timeout)
             soup = BeautifulSoup(page_response.content, "html.parser")
             titles = soup.find_all("div", class_="dicussion-title-container")
             
@@ -595,7 +757,8 @@ def download_and_compress_image(img_url, max_size=(800, 600), quality=85):
     Download and compress an image, return the optimized image data
     """
     try:
-        response = respectful_request(img_url)
+        # Images aren't held to the page rate, they are fetched alongside the question page
+        response = respectful_request(img_url, rate_limited=False)
         if not response:
             return None
             
@@ -9,18 +9,307 @@ import sys
 import json
 import time
 import random
-import requests
 import re
-from bs4 import BeautifulSoup
+import threading
+from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 
 # Add the scripts directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from scraper import HEADERS, respectful_request, scrape_questions, save_json, load_json
-from progress_manager import ProgressManager, LegacyProgressAdapter
+from scraper import (HEADERS, QUESTION_NUMBER_RE, RATE_LIMITER, fetch_page_bytes, scrape_questions,
+                     save_json_atomic, load_json, load_json_cached)
+from progress_manager import ProgressManager, LegacyProgressAdapter, ThreadSafeProgressAdapter
 from tqdm import tqdm
 
+try:
+    # Lexbor-backed parser, much faster than html.parser on listing pages
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Fast JSON decoding for the manifest
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Streaming parser used for listing pages when selectolax is missing
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# C-backed lxml tree builder for the BeautifulSoup fallback when installed
+BS4_PARSER = "lxml" if etree is not None else "html.parser"
+
+# "Page <strong>X</strong> of <strong>N</strong>" on a listing page, group 1 being N
+PAGE_COUNT_RE = re.compile(
+    rb'discussion-list-page-indicator[^<]*<strong>\s*\d+\s*</strong>[^<]*<strong>\s*(\d+)\s*</strong>'
+)
+# Interrupted link collections resume from this file
+LINKS_CHECKPOINT_PATH = "public/data/.servicenow_links_checkpoint.json"
+# Consecutive listing pages without a new question before an incremental collection stops
+STABLE_PAGES_TO_STOP = 3
+# Lowercased exam code in a discussion link
+EXAM_SLUG_RE = re.compile(r'/view/\d+-exam-(.+?)-topic-\d+-question-\d+')
+
+
+def compile_target_exam_re(target_exam_codes):
+    """
+    Builds one regex matching "Exam <code>" in a discussion title for the
+    target exam codes only, group 1 being the code
+    A code must match the whole title code ("CIS" doesn't match "Exam CIS-ITSM"),
+    codes are case sensitive (lowercase allowed for CIS-Discovery)
+    """
+    codes = sorted(map(re.escape, set(target_exam_codes)), key=len, reverse=True)
+    alternation = '|'.join(codes) if codes else '(?!)'
+    return re.compile(r'Exam\s+(' + alternation + r')(?![A-Za-z0-9-])')
+
+def question_number(link, _search=QUESTION_NUMBER_RE.search):
+    """
+    Question number of a discussion link, 0 when absent
+    """
+    match = _search(link)
+    return int(match.group(1)) if match else 0
+
+def parse_page_count(content):
+    """
+    Extracts the total number of discussion pages from a listing page
+    """
+    # The indicator is tiny, scan the raw bytes before building any tree
+    match = PAGE_COUNT_RE.search(content)
+    if match:
+        return int(match.group(1))
+    
+    if LexborHTMLParser is not None:
+        dom = LexborHTMLParser(content)
+        page_indicator = dom.css_first("span.discussion-list-page-indicator")
+        if not page_indicator:
+            raise Exception("Page indicator not found")
+        strong_texts = [strong.text() for strong in page_indicator.css("strong")]
+    else:
+        soup = BeautifulSoup(content, BS4_PARSER)
+        page_indicator = soup.find("span", class_="discussion-list-page-indicator")
+        if not page_indicator:
+            raise Exception("Page indicator not found")
+        strong_texts = [strong.text for strong in page_indicator.find_all("strong")]
+    
+    if len(strong_texts) < 2:
+        raise Exception("Unexpected page indicator format")
+    
+    return int(strong_texts[1])
+
+class DiscussionLinkCollector:
+    """
+    lxml parser target collecting (href, text) for the links inside
+    div.dicussion-title-container, without building a tree
+    """
+    
+    def __init__(self):
+        self.links = []
+        self._depth = 0  # Element depth inside a title container, 0 outside
+        self._link_depth = 0
+        self._href = None
+        self._text = []
+    
+    def start(self, tag, attrib):
+        if self._depth:
+            self._depth += 1
+            href = attrib.get("href")
+            if tag == "a" and href and self._href is None:
+                self._href = href
+                self._link_depth = self._depth
+                self._text = []
+        elif tag == "div" and "dicussion-title-container" in attrib.get("class", "").split():
+            self._depth = 1
+    
+    def end(self, tag):
+        if not self._depth:
+            return
+        if self._href is not None and self._depth == self._link_depth:
+            self.links.append((self._href, "".join(self._text)))
+            self._href = None
+        self._depth -= 1
+    
+    def data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+    
+    def close(self):
+        # Reset, so one parser and target serve every page
+        links, self.links = self.links, []
+        self._depth = 0
+        self._href = None
+        return links
+
+_lxml_parsers = threading.local()
+
+def get_link_parser():
+    """
+    lxml HTMLParser with a DiscussionLinkCollector target, created once per
+    thread (lxml parsers can't be shared between threads) and reused for every page
+    """
+    parser = getattr(_lxml_parsers, "parser", None)
+    if parser is None:
+        parser = etree.HTMLParser(target=DiscussionLinkCollector(), encoding="utf-8")
+        _lxml_parsers.parser = parser
+    return parser
+
+def iter_discussion_links(content):
+    """
+    Yields (href, get_title_text) for each linked discussion title on a listing page
+    get_title_text() returns the raw link text, only extracted when asked for
+    """
+    if LexborHTMLParser is not None:
+        dom = LexborHTMLParser(content)
+        for a_tag in dom.css("div.dicussion-title-container a[href]"):
+            href = a_tag.attributes.get("href")
+            if href:
+                yield href, a_tag.text
+    elif etree is not None:
+        # SAX-like: only the title links are collected, no tree is built
+        for href, title_text in etree.fromstring(content, get_link_parser()):
+            yield href, (lambda title_text=title_text: title_text)
+    else:
+        # Only build the title containers, not the whole page
+        only_titles = SoupStrainer("div", class_="dicussion-title-container")
+        soup = BeautifulSoup(content, BS4_PARSER, parse_only=only_titles)
+        for a_tag in soup.find_all("a", href=True):
+            if a_tag["href"]:
+                yield a_tag["href"], a_tag.get_text
+
+def iter_exam_links(content, target_exam_re, target_slugs):
+    """
+    Yields (exam_code, link) for each discussion of a target exam on a listing page
+    The exam code is read from the link slug (...-exam-<code>-topic-...) when
+    it names a target exam, the title text is only looked at for other links
+    (another format, or a slug that doesn't spell the code the same way)
+    target_slugs maps lowercased exam codes to exam codes
+    Exam codes are interned, the same few codes repeat on every page
+    """
+    for link, get_title_text in iter_discussion_links(content):
+        slug_match = EXAM_SLUG_RE.search(link)
+        if slug_match:
+            exam_code = target_slugs.get(slug_match.group(1))
+            if exam_code:
+                yield exam_code, link
+                continue
+        
+        # Chercher les patterns d'examens ServiceNow dans le titre (une seule regex)
+        exam_match = target_exam_re.search(get_title_text())
+        if exam_match:
+            yield sys.intern(exam_match.group(1)), link
+
+def fetch_listing_pages(base_url, num_pages, concurrency=1, page_nums=None):
+    """
+    Fetches listing pages 1..num_pages (or only page_nums) and yields
+    (page_num, body bytes or None) in page order
+    Each worker keeps the respectful 2-4s delay after its request, so
+    concurrency=1 behaves exactly like the serial loop
+    """
+    def fetch(page_num):
+        page_content = fetch_page_bytes(f"{base_url}{page_num}/")
+        # Respectful delay between pages
+        if page_num < num_pages:
+            time.sleep(random.uniform(2, 4))
+        return page_num, page_content
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        if page_nums is None:
+            page_nums = range(1, num_pages + 1)
+        yield from executor.map(fetch, page_nums)
+    finally:
+        # Don't keep fetching pages nobody will read if the caller bails out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+class LinksCheckpoint:
+    """
+    Link collection state saved every few pages, so an interrupted collection
+    resumes where it stopped instead of crawling every listing page again
+    A checkpoint is only reused for the same page count and target exams,
+    while it is recent enough for the listing pages not to have shifted much
+    """
+    
+    def __init__(self, path, num_pages, target_exam_codes, save_every=10, max_age=6 * 3600):
+        self.path = path
+        self.num_pages = num_pages
+        self.targets = sorted(target_exam_codes)
+        self.save_every = save_every
+        self.max_age = max_age
+        self.completed_pages = set()
+        self._unsaved = 0
+    
+    def load(self, exam_links):
+        """
+        Seeds exam_links with the checkpointed links and returns the completed pages
+        """
+        state = load_json(self.path)
+        if (not state
+                or state.get('num_pages') != self.num_pages
+                or state.get('targets') != self.targets
+                or time.time() - state.get('saved_at', 0) > self.max_age):
+            return self.completed_pages
+        
+        for exam_code, numbered_links in state.get('exam_links', {}).items():
+            if exam_code in exam_links:
+                exam_links[exam_code].extend((qnum, link) for qnum, link in numbered_links)
+        self.completed_pages = set(state.get('completed_pages', []))
+        return self.completed_pages
+    
+    def page_done(self, page_num, exam_links):
+        """
+        Records a collected page, saving the state every save_every pages
+        """
+        self.completed_pages.add(page_num)
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save(exam_links)
+    
+    def save(self, exam_links):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        save_json_atomic({
+            'num_pages': self.num_pages,
+            'targets': self.targets,
+            'saved_at': time.time(),
+            'completed_pages': sorted(self.completed_pages),
+            'exam_links': exam_links
+        }, self.path)
+        self._unsaved = 0
+    
+    def clear(self):
+        """
+        Removes the checkpoint once the collection went through every page
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def load_known_links(target_exam_codes, data_dir="public/data"):
+    """
+    Links already dispatched for the target exams, as {exam_code: [(qnum, link), ...]}
+    Returns None when an exam has no links yet, since only a full pass can find them
+    """
+    known_links = {}
+    for exam_code in target_exam_codes:
+        links = load_json_cached(f"{data_dir}/{exam_code}/links.json").get('links')
+        if not links:
+            return None
+        known_links[exam_code] = [(question_number(link), link) for link in links]
+    return known_links
+
+@lru_cache(maxsize=1)
+def _read_manifest_exam_codes(manifest_path, mtime):
+    """
+    Reads exam codes from the manifest (cached per path and modification time,
+    so edits to the manifest invalidate the cache)
+    """
+    with open(manifest_path, 'rb') as f:
+        data = f.read()
+    manifest = orjson.loads(data) if orjson is not None else json.loads(data)
+    return tuple(exam['code'] for exam in manifest.get('exams', []))
 
 def load_servicenow_exams_from_manifest():
     """
@@ -34,10 +323,7 @@ def load_servicenow_exams_from_manifest():
         return []
     
     try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-        
-        exam_codes = [exam['code'] for exam in manifest.get('exams', [])]
+        exam_codes = list(_read_manifest_exam_codes(manifest_path, os.path.getmtime(manifest_path)))
         print(f"✅ Found {len(exam_codes)} ServiceNow exams in manifest")
         print(f"📝 Exams: {', '.join(sorted(exam_codes))}")
         
@@ -47,10 +333,13 @@ def load_servicenow_exams_from_manifest():
         print(f"❌ Error reading manifest: {e}")
         return []
 
-def batch_collect_servicenow_links(target_exam_codes, progress):
+def batch_collect_servicenow_links(target_exam_codes, progress, concurrency=1, force_update=False):
     """
     Collects all ServiceNow links in a single pass through pages
     Optimized to target only exams from the manifest
+    concurrency: number of listing pages fetched in parallel (1 = serial)
+    Stops once a few pages in a row bring no new question number, keeping the
+    links already dispatched (force_update walks every page)
     """
     print(f"\n🚀 Batch collecting ServiceNow links for {len(target_exam_codes)} exams...")
     
@@ -58,79 +347,92 @@ def batch_collect_servicenow_links(target_exam_codes, progress):
     SERVICENOW_CATEGORY = "servicenow"  # ServiceNow category on ExamTopics
     
     # Structure to collect links per exam
-    exam_links = defaultdict(list)
+    exam_links = {sys.intern(exam_code): [] for exam_code in target_exam_codes}
     
     # Base URL for ServiceNow
     base_url = f"{PREFIX}{SERVICENOW_CATEGORY}/"
     
     # Get total number of ServiceNow pages
-    response = respectful_request(base_url)
-    if not response:
+    first_page = fetch_page_bytes(base_url)
+    if not first_page:
         raise Exception("Unable to access ServiceNow pages")
     
-    soup = BeautifulSoup(response.content, "html.parser")
-    page_indicator = soup.find("span", class_="discussion-list-page-indicator")
-    if not page_indicator:
-        raise Exception("Page indicator not found")
-    
-    strong_tags = page_indicator.find_all("strong")
-    if len(strong_tags) < 2:
-        raise Exception("Unexpected page indicator format")
-    
-    num_pages = int(strong_tags[1].text)
+    num_pages = parse_page_count(first_page)
     print(f"📄 {num_pages} ServiceNow pages to analyze")
     
     # Convert target exam list to set for fast lookup
-    target_exam_set = set(target_exam_codes)
-    
-    # Parcourir toutes les pages ServiceNow une seule fois
-    for page_num in range(1, num_pages + 1):
-        page_url = f"{base_url}{page_num}/"
-        progress.progress(
-            page_num / num_pages, 
-            f"Analyzing page {page_num}/{num_pages} - Collecting ServiceNow links"
-        )
-        
-        page_response = respectful_request(page_url)
-        if not page_response:
-            print(f"⚠️  Failed page {page_num}, moving to next")
-            continue
-        
-        soup = BeautifulSoup(page_response.content, "html.parser")
-        titles = soup.find_all("div", class_="dicussion-title-container")
-        
-        # Analyser chaque discussion sur cette page
-        for title in titles:
-            if not title.text:
+    target_exam_set = {sys.intern(exam_code) for exam_code in target_exam_codes}
+    target_exam_re = compile_target_exam_re(target_exam_set)
+    target_slugs = {code.lower(): code for code in target_exam_set}
+    
+    # Reprendre une collecte interrompue sur les mêmes pages
+    checkpoint = LinksCheckpoint(LINKS_CHECKPOINT_PATH, num_pages, target_exam_set)
+    completed_pages = checkpoint.load(exam_links)
+    # One dict hit per link, straight to the bound append of the exam's list
+    append_link = {exam_code: numbered_links.append for exam_code, numbered_links in exam_links.items()}
+    if completed_pages:
+        print(f"♻️  Resuming: {len(completed_pages)} pages already collected")
+    remaining_pages = [page_num for page_num in range(1, num_pages + 1) if page_num not in completed_pages]
+    pages_resumed = num_pages - len(remaining_pages)
+    
+    # Incremental run: highest question number already dispatched per exam
+    known_links = None if force_update else load_known_links(target_exam_set)
+    known_max = {code: max(n for n, _ in links) for code, links in known_links.items()} if known_links else None
+    stable_pages = 0
+    stopped_early = False
+    pages_analyzed = 0
+    pages_skipped = 0
+    
+    # Parcourir toutes les pages ServiceNow une seule fois (`concurrency` à la fois)
+    try:
+        for page_num, page_content in fetch_listing_pages(base_url, num_pages, concurrency, remaining_pages):
+            progress.progress(
+                page_num / num_pages, 
+                f"Analyzing page {page_num}/{num_pages} - Collecting ServiceNow links"
+            )
+            
+            if not page_content:
+                print(f"⚠️  Failed page {page_num}, moving to next")
                 continue
             
-            title_text = title.text.strip()
+            # Analyser chaque discussion sur cette page
+            new_questions = False
+            for exam_code, link in iter_exam_links(page_content, target_exam_re, target_slugs):
+                qnum = question_number(link)
+                append_link[exam_code]((qnum, link))
+                if known_max is not None and qnum > known_max[exam_code]:
+                    new_questions = True
+            checkpoint.page_done(page_num, exam_links)
+            pages_analyzed += 1
             
-            # Chercher les patterns d'examens ServiceNow
-            if "Exam " in title_text:
-                # Extraire le code d'examen du titre (support des minuscules pour CIS-Discovery)
-                exam_match = re.search(r'Exam\s+([A-Za-z0-9-]+)', title_text)
-                if exam_match:
-                    exam_code = exam_match.group(1)
-                    
-                    # Vérifier si c'est un des examens qu'on veut
-                    if exam_code in target_exam_set:
-                        a_tag = title.find("a")
-                        if a_tag and "href" in a_tag.attrs:
-                            link = a_tag["href"]
-                            exam_links[exam_code].append(link)
-        
-        # Délai respectueux entre les pages
-        if page_num < num_pages:
-            delay = random.uniform(2, 4)
-            time.sleep(delay)
-    
-    # Sort links for each exam by question number
-    for exam_code in exam_links:
-        exam_links[exam_code] = sorted(
-            exam_links[exam_code], 
-            key=lambda link: int(re.search(r'question-(\d+)', link).group(1)) if re.search(r'question-(\d+)', link) else 0
-        )
+            if known_max is not None:
+                stable_pages = 0 if new_questions else stable_pages + 1
+                if stable_pages >= STABLE_PAGES_TO_STOP:
+                    # Pages are yielded in order, everything after this one is left unfetched
+                    pages_skipped = len(remaining_pages) - remaining_pages.index(page_num) - 1
+                    print(f"⏩ No new questions on the last {stable_pages} pages, stopping at page {page_num} "
+                          f"({pages_skipped} older pages skipped on purpose)")
+                    stopped_early = True
+                    break
+    except BaseException:
+        # Interrupted (error, Ctrl-C): keep every collected page for the next run
+        checkpoint.save(exam_links)
+        raise
+    
+    checkpoint.clear()
+    if stopped_early:
+        # Older discussions weren't fetched again, keep the links already dispatched
+        for exam_code, numbered_links in known_links.items():
+            exam_links[exam_code].extend(numbered_links)
+    
+    # Sort links for each exam by question number (numbered while collecting),
+    # keeping only the exams that were found (a resumed page may repeat links)
+    # The key only looks at the number, so equal numbers keep their page order
+    exam_links = {
+        exam_code: [link for _, link in sorted(dict.fromkeys(numbered_links), key=itemgetter(0))]
+        for exam_code, numbered_links in exam_links.items()
+        if numbered_links
+    }
     
     # Statistics
     total_links = sum(len(links) for links in exam_links.values())
@@ -140,104 +442,122 @@ def batch_collect_servicenow_links(target_exam_codes, progress):
     print(f"\n📊 Collection results:")
     print(f"   ✅ Exams found: {found_exams}/{len(target_exam_codes)}")
     print(f"   📝 Total links collected: {total_links}")
+    print(f"   📄 Pages analyzed: {pages_analyzed}/{num_pages}")
+    if pages_resumed:
+        print(f"   ♻️  Pages resumed from checkpoint: {pages_resumed}")
+    if pages_skipped:
+        print(f"   ⏩ Pages skipped (no new questions): {pages_skipped}")
     
     if missing_exams > 0:
-        missing_list = target_exam_set - set(exam_links.keys())
+        missing_list = target_exam_set - exam_links.keys()
         print(f"   ⚠️  Exams not found: {', '.join(sorted(missing_list))}")
     
-    return dict(exam_links), num_pages
+    return exam_links, num_pages
 
-def batch_collect_servicenow_links_with_progress(target_exam_codes, progress_manager):
+def batch_collect_servicenow_links_with_progress(target_exam_codes, progress_manager, concurrency=1,
+                                                 force_update=False):
     """
     Version améliorée avec barres de progression multi-niveaux
     Collecte tous les liens ServiceNow en un seul passage sur les pages
+    concurrency: number of listing pages fetched in parallel (1 = serial)
+    Stops once a few pages in a row bring no new question number, keeping the
+    links already dispatched (force_update walks every page)
     """
     PREFIX = "https://www.examtopics.com/discussions/"
     SERVICENOW_CATEGORY = "servicenow"
     
     # Structure to collect links per exam
-    exam_links = defaultdict(list)
+    exam_links = {sys.intern(exam_code): [] for exam_code in target_exam_codes}
     
     # Base URL for ServiceNow
     base_url = f"{PREFIX}{SERVICENOW_CATEGORY}/"
     
     # Get total number of ServiceNow pages
-    response = respectful_request(base_url)
-    if not response:
+    first_page = fetch_page_bytes(base_url)
+    if not first_page:
         raise Exception("Unable to access ServiceNow pages")
     
-    soup = BeautifulSoup(response.content, "html.parser")
-    page_indicator = soup.find("span", class_="discussion-list-page-indicator")
-    if not page_indicator:
-        raise Exception("Page indicator not found")
+    num_pages = parse_page_count(first_page)
     
-    strong_tags = page_indicator.find_all("strong")
-    if len(strong_tags) < 2:
-        raise Exception("Unexpected page indicator format")
+    # Convert target exam list to set for fast lookup
+    target_exam_set = {sys.intern(exam_code) for exam_code in target_exam_codes}
+    target_exam_re = compile_target_exam_re(target_exam_set)
+    target_slugs = {code.lower(): code for code in target_exam_set}
     
-    num_pages = int(strong_tags[1].text)
+    # Resume an interrupted collection of the same pages
+    checkpoint = LinksCheckpoint(LINKS_CHECKPOINT_PATH, num_pages, target_exam_set)
+    completed_pages = checkpoint.load(exam_links)
+    # One dict hit per link, straight to the bound append of the exam's list
+    append_link = {exam_code: numbered_links.append for exam_code, numbered_links in exam_links.items()}
+    if completed_pages:
+        tqdm.write(f"♻️  Resuming: {len(completed_pages)} pages already collected")
+    remaining_pages = [page_num for page_num in range(1, num_pages + 1) if page_num not in completed_pages]
+    pages_resumed = num_pages - len(remaining_pages)
     
-    # Convert target exam list to set for fast lookup
-    target_exam_set = set(target_exam_codes)
+    # Incremental run: highest question number already dispatched per exam
+    known_links = None if force_update else load_known_links(target_exam_set)
+    known_max = {code: max(n for n, _ in links) for code, links in known_links.items()} if known_links else None
+    stable_pages = 0
+    stopped_early = False
+    pages_analyzed = 0
+    pages_skipped = 0
     
     # Utiliser une sous-barre pour les pages
-    with progress_manager.sub_progress(
-        num_pages, 
-        f"Collecting links from {num_pages} ServiceNow pages",
-        "link_collection"
-    ):
-        # Go through all ServiceNow pages once
-        for page_num in range(1, num_pages + 1):
-            page_url = f"{base_url}{page_num}/"
-            
-            progress_manager.update_sub(f"Page {page_num}/{num_pages} - Analyzing...")
-            
-            page_response = respectful_request(page_url)
-            if not page_response:
-                progress_manager.update_sub(f"⚠️ Failed page {page_num}, moving to next")
-                continue
-            
-            soup = BeautifulSoup(page_response.content, "html.parser")
-            titles = soup.find_all("div", class_="dicussion-title-container")
-            
-            # Analyze each discussion on this page
-            links_found_this_page = 0
-            for title in titles:
-                if not title.text:
+    try:
+        with progress_manager.sub_progress(
+            len(remaining_pages), 
+            f"Collecting links from {len(remaining_pages)} ServiceNow pages",
+            "link_collection"
+        ):
+            # Go through all ServiceNow pages once (fetched `concurrency` at a time)
+            for page_num, page_content in fetch_listing_pages(base_url, num_pages, concurrency, remaining_pages):
+                if not page_content:
+                    progress_manager.update_sub(f"⚠️ Failed page {page_num}, moving to next")
                     continue
                 
-                title_text = title.text.strip()
+                # Analyze each discussion on this page
+                links_found_this_page = 0
+                new_questions = False
+                for exam_code, link in iter_exam_links(page_content, target_exam_re, target_slugs):
+                    qnum = question_number(link)
+                    append_link[exam_code]((qnum, link))
+                    links_found_this_page += 1
+                    if known_max is not None and qnum > known_max[exam_code]:
+                        new_questions = True
+                checkpoint.page_done(page_num, exam_links)
+                pages_analyzed += 1
                 
-                # Look for ServiceNow exam patterns
-                if "Exam " in title_text:
-                    # Extract exam code from title
-                    exam_match = re.search(r'Exam\s+([A-Za-z0-9-]+)', title_text)
-                    if exam_match:
-                        exam_code = exam_match.group(1)
-                        
-                        # Check if this is one of the exams we want
-                        if exam_code in target_exam_set:
-                            a_tag = title.find("a")
-                            if a_tag and "href" in a_tag.attrs:
-                                link = a_tag["href"]
-                                exam_links[exam_code].append(link)
-                                links_found_this_page += 1
-            
-            if links_found_this_page > 0:
                 progress_manager.update_sub(f"Page {page_num}/{num_pages} - {links_found_this_page} links found")
-            
-            # Respectful delay between pages
-            if page_num < num_pages:
-                delay = random.uniform(2, 4)
-                time.sleep(delay)
-    
-    # Sort links for each exam by question number
-    for exam_code in exam_links:
-        exam_links[exam_code] = sorted(
-            exam_links[exam_code], 
-            key=lambda link: int(re.search(r'question-(\d+)', link).group(1)) 
-            if re.search(r'question-(\d+)', link) else 0
-        )
+                
+                if known_max is not None:
+                    stable_pages = 0 if new_questions else stable_pages + 1
+                    if stable_pages >= STABLE_PAGES_TO_STOP:
+                        # Pages are yielded in order, everything after this one is left unfetched
+                        pages_skipped = len(remaining_pages) - remaining_pages.index(page_num) - 1
+                        tqdm.write(f"⏩ No new questions on the last {stable_pages} pages, stopping at page {page_num} "
+                                   f"({pages_skipped} older pages skipped on purpose)")
+                        progress_manager.skip_sub(pages_skipped, f"{pages_skipped} older pages skipped, no new questions")
+                        stopped_early = True
+                        break
+    except BaseException:
+        # Interrupted (error, Ctrl-C): keep every collected page for the next run
+        checkpoint.save(exam_links)
+        raise
+    
+    checkpoint.clear()
+    if stopped_early:
+        # Older discussions weren't fetched again, keep the links already dispatched
+        for exam_code, numbered_links in known_links.items():
+            exam_links[exam_code].extend(numbered_links)
+    
+    # Sort links for each exam by question number (numbered while collecting),
+    # keeping only the exams that were found (a resumed page may repeat links)
+    # The key only looks at the number, so equal numbers keep their page order
+    exam_links = {
+        exam_code: [link for _, link in sorted(dict.fromkeys(numbered_links), key=itemgetter(0))]
+        for exam_code, numbered_links in exam_links.items()
+        if numbered_links
+    }
     
     # Statistics
     total_links = sum(len(links) for links in exam_links.values())
@@ -248,63 +568,119 @@ def batch_collect_servicenow_links_with_progress(target_exam_codes, progress_man
         "Link Collection",
         exams_found_count=found_exams,
         total_links_count=total_links,
-        pages_analyzed_count=num_pages
+        pages_analyzed_count=pages_analyzed,
+        pages_resumed_count=pages_resumed,
+        pages_skipped_count=pages_skipped
     )
     
     if missing_exams > 0:
-        missing_list = target_exam_set - set(exam_links.keys())
+        missing_list = target_exam_set - exam_links.keys()
         print(f"   ⚠️  Exams not found: {', '.join(sorted(missing_list))}")
     
-    return dict(exam_links), num_pages
+    return exam_links, num_pages
 
-def dispatch_servicenow_links(exam_links, target_exam_codes, total_pages):
+def write_exam_links(exam_code, links, total_pages, existing_dirs=None):
+    """
+    Writes links.json for one exam and reports whether the exam is new
+    The file is left untouched when only collected_at would change
+    existing_dirs: names of the exam directories already in public/data, if known
+    Returns "updated" if exam.json already exists, "created" otherwise
+    """
+    exam_dir = f"public/data/{exam_code}"
+    new_dir = existing_dirs is not None and exam_code not in existing_dirs
+    if existing_dirs is None or new_dir:
+        os.makedirs(exam_dir, exist_ok=True)
+    
+    links_path = f"{exam_dir}/links.json"
+    
+    # Create optimized links.json object
+    links_obj = {
+        "page_num": total_pages,
+        "status": "complete", 
+        "links": links,
+        "collected_at": datetime.now().isoformat(),
+        "method": "servicenow_batch_collection",
+        "exam_code": exam_code,
+        "links_count": len(links)
+    }
+    
+    existing_obj = load_json_cached(links_path)
+    if not links_unchanged(existing_obj, links_obj):
+        save_json_atomic(links_obj, links_path)
+    
+    # Check if it's an update or creation (a directory we just created has no exam.json)
+    exam_json_path = f"{exam_dir}/exam.json"
+    return "updated" if not new_dir and os.path.exists(exam_json_path) else "created"
+
+def list_exam_dirs(data_dir="public/data"):
+    """
+    Names of the directories in data_dir, read with a single scandir
+    """
+    try:
+        with os.scandir(data_dir) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+def links_unchanged(existing_obj, links_obj):
+    """
+    True when two links.json objects only differ by their collected_at
+    """
+    if len(existing_obj) != len(links_obj):
+        return False
+    return all(
+        key == "collected_at" or existing_obj.get(key) == value
+        for key, value in links_obj.items()
+    )
+
+def submit_exam_links_writes(executor, exam_links, target_exam_codes, total_pages):
+    """
+    Submits one links.json write per exam with links
+    Returns ({future: exam_code}, [exam codes without links])
+    """
+    futures = {}
+    missing = []
+    # One directory listing instead of a mkdir per exam
+    existing_dirs = list_exam_dirs()
+    for exam_code in target_exam_codes:
+        links = exam_links.get(exam_code, [])
+        if not links:
+            missing.append(exam_code)
+            continue
+        futures[executor.submit(write_exam_links, exam_code, links, total_pages, existing_dirs)] = exam_code
+    return futures, missing
+
+def dispatch_servicenow_links(exam_links, target_exam_codes, total_pages, max_workers=8):
     """
     Dispatches collected links to ServiceNow exam folders
+    Files are independent, so they are written in parallel
     """
     print(f"\n📨 Dispatching ServiceNow links...")
     
     dispatched_count = 0
     updated_count = 0
     
-    for exam_code in target_exam_codes:
-        links = exam_links.get(exam_code, [])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures, missing = submit_exam_links_writes(executor, exam_links, target_exam_codes, total_pages)
         
-        if not links:
+        for exam_code in missing:
             print(f"⚠️  {exam_code}: No links found")
-            continue
-        
-        exam_dir = f"public/data/{exam_code}"
-        os.makedirs(exam_dir, exist_ok=True)
-        
-        links_path = f"{exam_dir}/links.json"
-        
-        # Créer l'objet links.json optimisé
-        links_obj = {
-            "page_num": total_pages,
-            "status": "complete", 
-            "links": links,
-            "collected_at": datetime.now().isoformat(),
-            "method": "servicenow_batch_collection",
-            "exam_code": exam_code,
-            "links_count": len(links)
-        }
         
-        try:
-            save_json(links_obj, links_path)
-            
-            # Vérifier si c'est une mise à jour ou création
-            exam_json_path = f"{exam_dir}/exam.json"
-            if os.path.exists(exam_json_path):
-                updated_count += 1
-                status = "updated"
-            else:
-                dispatched_count += 1
-                status = "created"
-            
-            print(f"✅ {exam_code}: {len(links)} links → {status}")
-            
-        except Exception as e:
-            print(f"❌ {exam_code}: Save error - {e}")
+        for future in as_completed(futures):
+            exam_code = futures[future]
+            try:
+                status = future.result()
+                
+                # Vérifier si c'est une mise à jour ou création
+                if status == "updated":
+                    updated_count += 1
+                else:
+                    dispatched_count += 1
+                
+                print(f"✅ {exam_code}: {len(exam_links[exam_code])} links → {status}")
+                
+            except Exception as e:
+                print(f"❌ {exam_code}: Save error - {e}")
     
     print(f"\n📊 Dispatch summary:")
     print(f"   🆕 New exams: {dispatched_count}")
@@ -312,53 +688,35 @@ def dispatch_servicenow_links(exam_links, target_exam_codes, total_pages):
     
     return dispatched_count + updated_count
 
-def dispatch_servicenow_links_with_progress(exam_links, target_exam_codes, total_pages, progress_manager):
+def dispatch_servicenow_links_with_progress(exam_links, target_exam_codes, total_pages, progress_manager,
+                                            max_workers=8):
     """
     Version améliorée avec barres de progression
     Dispatche les liens collectés vers les dossiers d'examens ServiceNow
+    Les fichiers sont indépendants et écrits en parallèle
     """
     dispatched_count = 0
     updated_count = 0
     
     # Utiliser une sous-barre pour le dispatch
-    with progress_manager.sub_progress(len(target_exam_codes), "Dispatch des liens par examen"):
+    with progress_manager.sub_progress(len(target_exam_codes), "Dispatch des liens par examen"), \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures, missing = submit_exam_links_writes(executor, exam_links, target_exam_codes, total_pages)
         
-        for exam_code in target_exam_codes:
-            links = exam_links.get(exam_code, [])
-            
-            if not links:
-                progress_manager.update_sub(f"⚠️ {exam_code}: No links found")
-                continue
-            
-            exam_dir = f"public/data/{exam_code}"
-            os.makedirs(exam_dir, exist_ok=True)
-            
-            links_path = f"{exam_dir}/links.json"
-            
-            # Create optimized links.json object
-            links_obj = {
-                "page_num": total_pages,
-                "status": "complete", 
-                "links": links,
-                "collected_at": datetime.now().isoformat(),
-                "method": "servicenow_batch_collection",
-                "exam_code": exam_code,
-                "links_count": len(links)
-            }
-            
+        for exam_code in missing:
+            progress_manager.update_sub(f"⚠️ {exam_code}: No links found")
+        
+        for future in as_completed(futures):
+            exam_code = futures[future]
             try:
-                save_json(links_obj, links_path)
+                status = future.result()
                 
-                # Check if it's an update or creation
-                exam_json_path = f"{exam_dir}/exam.json"
-                if os.path.exists(exam_json_path):
+                if status == "updated":
                     updated_count += 1
-                    status = "updated"
                 else:
                     dispatched_count += 1
-                    status = "created"
                 
-                progress_manager.update_sub(f"✅ {exam_code}: {len(links)} links → {status}")
+                progress_manager.update_sub(f"✅ {exam_code}: {len(exam_links[exam_code])} links → {status}")
                 
             except Exception as e:
                 progress_manager.update_sub(f"❌ {exam_code}: Save error - {e}")
@@ -373,90 +731,113 @@ def dispatch_servicenow_links_with_progress(exam_links, target_exam_codes, total
     
     return dispatched_count + updated_count
 
-def process_servicenow_questions(exam_codes, progress, force_update=False):
+class ExamProgress:
     """
-    Processes questions for all ServiceNow exams
+    Progress tracker for one exam, prints timestamped lines prefixed with the exam code
     """
-    print(f"\n📝 Processing ServiceNow questions for {len(exam_codes)} exams...")
     
-    results = []
-    successful = 0
-    failed = 0
-    total_questions_processed = 0
-    
-    for i, exam_code in enumerate(exam_codes):
-        print(f"\n📚 ServiceNow exam {i+1}/{len(exam_codes)}: {exam_code}")
+    def __init__(self, exam_code):
+        self.exam_code = exam_code
+        self._prefix = f"{exam_code}:"
+        self._stamp_second = None
+        self._stamp = ""
         
-        exam_dir = f"public/data/{exam_code}"
-        links_path = f"{exam_dir}/links.json"
-        questions_path = f"{exam_dir}/exam.json"
+    def progress(self, value, text=""):
+        # The timestamp only changes once a second, format it once per second
+        second = int(time.time())
+        if second != self._stamp_second:
+            self._stamp_second = second
+            self._stamp = time.strftime('%H:%M:%S', time.localtime(second))
+        print(f"[{self._stamp}] {self._prefix} {text}")
+
+def process_servicenow_exam(exam_code, links, questions_path, force_update=False):
+    """
+    Scrapes the questions of one ServiceNow exam and returns its result entry
+    """
+    try:
+        # Progress tracker spécifique à cet examen
+        exam_progress = ExamProgress(exam_code)
         
-        # Charger les liens pré-collectés
-        links_obj = load_json(links_path)
-        if not links_obj or not links_obj.get("links"):
-            print(f"❌ {exam_code}: Missing links")
-            failed += 1
-            continue
+        # Utiliser le scraper existant pour les questions
+        questions_obj = scrape_questions(
+            links, 
+            questions_path, 
+            exam_progress, 
+            rapid_scraping=False,  # Mode respectueux
+            force_update=force_update
+        )
         
-        links = links_obj["links"]
-        print(f"📄 {len(links)} questions to process for {exam_code}")
+        questions = questions_obj.get("questions", [])
+        error = questions_obj.get("error", "")
         
-        try:
-            # Progress tracker spécifique à cet examen
-            class ExamProgress:
-                def __init__(self, exam_code):
-                    self.exam_code = exam_code
-                    
-                def progress(self, value, text=""):
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    print(f"[{timestamp}] {self.exam_code}: {text}")
-            
-            exam_progress = ExamProgress(exam_code)
-            
-            # Utiliser le scraper existant pour les questions
-            questions_obj = scrape_questions(
-                links, 
-                questions_path, 
-                exam_progress, 
-                rapid_scraping=False,  # Mode respectueux
-                force_update=force_update
-            )
-            
-            questions = questions_obj.get("questions", [])
-            error = questions_obj.get("error", "")
-            
-            if error:
-                print(f"⚠️  {exam_code}: {error}")
-                print(f"   📝 {len(questions)} questions retrieved despite error")
+        if error:
+            print(f"⚠️  {exam_code}: {error}")
+            print(f"   📝 {len(questions)} questions retrieved despite error")
+        
+        print(f"✅ {exam_code}: {len(questions)} questions processed successfully")
+        
+        return {
+            'exam_code': exam_code,
+            'status': 'success' if not error else 'partial',
+            'question_count': len(questions),
+            'error': error if error else None
+        }
+        
+    except Exception as e:
+        error_msg = str(e)
+        print(f"❌ {exam_code}: Exception - {error_msg}")
+        return failed_exam_result(exam_code, error_msg)
+
+def process_servicenow_questions(exam_codes, progress, force_update=False, exam_workers=1):
+    """
+    Processes questions for all ServiceNow exams
+    exam_workers: number of exams scraped in parallel (1 = one after another)
+    """
+    print(f"\n📝 Processing ServiceNow questions for {len(exam_codes)} exams...")
+    
+    results = []
+    missing = 0
+    
+    # Exams are independent (each one writes to its own directory), with
+    # several workers they are scraped concurrently
+    executor = ThreadPoolExecutor(max_workers=exam_workers) if exam_workers > 1 else None
+    futures = []
+    try:
+        for i, exam_code in enumerate(exam_codes):
+            print(f"\n📚 ServiceNow exam {i+1}/{len(exam_codes)}: {exam_code}")
             
-            result = {
-                'exam_code': exam_code,
-                'status': 'success' if not error else 'partial',
-                'question_count': len(questions),
-                'error': error if error else None
-            }
+            exam_dir = f"public/data/{exam_code}"
+            links_path = f"{exam_dir}/links.json"
+            questions_path = f"{exam_dir}/exam.json"
             
-            results.append(result)
-            successful += 1
-            total_questions_processed += len(questions)
+            # Charger les liens pré-collectés
+            links_obj = load_json_cached(links_path)
+            if not links_obj or not links_obj.get("links"):
+                print(f"❌ {exam_code}: Missing links")
+                missing += 1
+                continue
             
-            print(f"✅ {exam_code}: {len(questions)} questions processed successfully")
+            links = links_obj["links"]
+            print(f"📄 {len(links)} questions to process for {exam_code}")
             
-        except Exception as e:
-            error_msg = str(e)
-            print(f"❌ {exam_code}: Exception - {error_msg}")
-            results.append({
-                'exam_code': exam_code,
-                'status': 'failed',
-                'question_count': 0,
-                'error': error_msg
-            })
-            failed += 1
+            if executor is None:
+                results.append(process_servicenow_exam(exam_code, links, questions_path, force_update))
+            else:
+                futures.append(executor.submit(
+                    process_servicenow_exam, exam_code, links, questions_path, force_update
+                ))
         
-        # Respectful pause between exams
-        if i < len(exam_codes) - 1:
-            print(f"⏳ 15s pause before next exam...")
-            time.sleep(15)
+        for future in as_completed(futures):
+            results.append(future.result())
+    finally:
+        if executor is not None:
+            # Also on an error, so exams not started yet aren't scraped in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    exceptions = sum(1 for result in results if result['status'] == 'failed')
+    successful = len(results) - exceptions
+    failed = missing + exceptions
+    total_questions_processed = sum(result['question_count'] for result in results)
     
     print(f"\n📊 Final ServiceNow summary:")
     print(f"   ✅ Successful exams: {successful}")
@@ -465,101 +846,153 @@ def process_servicenow_questions(exam_codes, progress, force_update=False):
     
     return results
 
-def process_servicenow_questions_with_progress(exam_codes, progress_manager, force_update=False):
+def report_exam_questions(exam_code, questions_obj):
+    """
+    Writes the per-exam update summary and returns the exam result entry
+    """
+    questions = questions_obj.get("questions", [])
+    error = questions_obj.get("error", "")
+    update_stats = questions_obj.get("update_stats", {})
+    
+    if error:
+        tqdm.write(f"⚠️  {exam_code}: {error}")
+        tqdm.write(f"   📝 {len(questions)} questions retrieved despite error")
+    
+    # Display detailed update summary
+    new_count = update_stats.get("new_count", 0)
+    updated_count = update_stats.get("updated_count", 0)
+    skipped_count = update_stats.get("skipped_count", 0)
+    
+    if new_count > 0 or updated_count > 0 or skipped_count > 0:
+        tqdm.write(f"\n📊 Update Summary:")
+        tqdm.write(f"   ✅ New questions added: {new_count}")
+        tqdm.write(f"   🔄 Existing questions updated: {updated_count}")
+        tqdm.write(f"   ⏭️  Questions skipped (no changes): {skipped_count}")
+        
+        status_msg = "updated successfully" if not error else "updated with errors"
+        tqdm.write(f"✅ {exam_code}: {len(questions)} questions {status_msg}")
+    
+    return {
+        'exam_code': exam_code,
+        'status': 'success' if not error else 'partial',
+        'question_count': len(questions),
+        'error': error if error else None,
+        'update_stats': update_stats
+    }
+
+def failed_exam_result(exam_code, error_msg):
+    """
+    Result entry for an exam whose processing raised
+    """
+    return {
+        'exam_code': exam_code,
+        'status': 'failed',
+        'question_count': 0,
+        'error': error_msg
+    }
+
+def process_servicenow_questions_with_progress(exam_codes, progress_manager, force_update=False, exam_workers=1,
+                                              question_workers=1):
     """
     Version améliorée avec barres de progression multi-niveaux
     Traite les questions pour tous les examens ServiceNow avec suivi détaillé
+    exam_workers: number of exams scraped in parallel (1 = one after another)
+    question_workers: number of question pages fetched in parallel within an exam
     """
     results = []
     successful = 0
     failed = 0
     total_questions_processed = 0
     
-    for i, exam_code in enumerate(exam_codes):
+    # Charger les liens pré-collectés
+    exam_jobs = []
+    for exam_code in exam_codes:
         exam_dir = f"public/data/{exam_code}"
-        links_path = f"{exam_dir}/links.json"
-        questions_path = f"{exam_dir}/exam.json"
-        
-        # Charger les liens pré-collectés
-        links_obj = load_json(links_path)
+        links_obj = load_json_cached(f"{exam_dir}/links.json")
         if not links_obj or not links_obj.get("links"):
             progress_manager.update_sub(f"❌ {exam_code}: Missing links")
             failed += 1
             continue
-        
-        links = links_obj["links"]
-        
-        # Utiliser une sous-barre pour cet examen spécifique
+        exam_jobs.append((exam_code, links_obj["links"], f"{exam_dir}/exam.json"))
+    
+    if exam_workers > 1 and len(exam_jobs) > 1:
+        # Exams are independent: scrape them concurrently, each lane keeping
+        # the respectful per-question delays, under one shared sub-bar
+        total_links = sum(len(links) for _, links, _ in exam_jobs)
+        executor = ThreadPoolExecutor(max_workers=exam_workers)
         with progress_manager.sub_progress(
-            len(links), 
-            f"Examen {exam_code} ({len(links)} questions)", 
+            total_links,
+            f"{len(exam_jobs)} exams in parallel ({total_links} questions)",
             "question_processing"
         ):
-            
             try:
-                # Créer un adaptateur pour maintenir la compatibilité avec scrape_questions
-                legacy_adapter = LegacyProgressAdapter(progress_manager)
-                
-                # Utiliser le scraper existant pour les questions
-                questions_obj = scrape_questions(
-                    links, 
-                    questions_path, 
-                    legacy_adapter, 
-                    rapid_scraping=False,  # Mode respectueux
-                    force_update=force_update
-                )
-                
-                questions = questions_obj.get("questions", [])
-                error = questions_obj.get("error", "")
-                update_stats = questions_obj.get("update_stats", {})
-                
-                if error:
-                    tqdm.write(f"⚠️  {exam_code}: {error}")
-                    tqdm.write(f"   📝 {len(questions)} questions retrieved despite error")
-                
-                # Display detailed update summary
-                new_count = update_stats.get("new_count", 0)
-                updated_count = update_stats.get("updated_count", 0)
-                skipped_count = update_stats.get("skipped_count", 0)
-                
-                if new_count > 0 or updated_count > 0 or skipped_count > 0:
-                    tqdm.write(f"\n📊 Update Summary:")
-                    tqdm.write(f"   ✅ New questions added: {new_count}")
-                    tqdm.write(f"   🔄 Existing questions updated: {updated_count}")
-                    tqdm.write(f"   ⏭️  Questions skipped (no changes): {skipped_count}")
-                    
-                    status_msg = "updated successfully" if not error else "updated with errors"
-                    tqdm.write(f"✅ {exam_code}: {len(questions)} questions {status_msg}")
-                
-                result = {
-                    'exam_code': exam_code,
-                    'status': 'success' if not error else 'partial',
-                    'question_count': len(questions),
-                    'error': error if error else None,
-                    'update_stats': update_stats
+                shared_adapter = ThreadSafeProgressAdapter(progress_manager)
+                futures = {
+                    executor.submit(
+                        scrape_questions,
+                        links,
+                        questions_path,
+                        shared_adapter,
+                        rapid_scraping=False,  # Mode respectueux
+                        force_update=force_update,
+                        workers=question_workers
+                    ): (exam_code, links)
+                    for exam_code, links, questions_path in exam_jobs
                 }
                 
-                results.append(result)
-                successful += 1
-                total_questions_processed += len(questions)
+                for future in as_completed(futures):
+                    exam_code, links = futures[future]
+                    try:
+                        result = report_exam_questions(exam_code, future.result())
+                        results.append(result)
+                        successful += 1
+                        total_questions_processed += result['question_count']
+                    except Exception as e:
+                        error_msg = str(e)
+                        tqdm.write(f"❌ {exam_code}: Exception - {error_msg}")
+                        results.append(failed_exam_result(exam_code, error_msg))
+                        failed += 1
+                    
+                    progress_manager.update_main(f"Exam {exam_code} completed: {len(links)} questions")
+            finally:
+                # Also on an error, so exams not started yet aren't scraped in the background
+                executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        for exam_code, links, questions_path in exam_jobs:
+            # Utiliser une sous-barre pour cet examen spécifique
+            with progress_manager.sub_progress(
+                len(links), 
+                f"Examen {exam_code} ({len(links)} questions)", 
+                "question_processing"
+            ):
                 
-            except Exception as e:
-                error_msg = str(e)
-                progress_manager.update_sub(f"❌ {exam_code}: Exception - {error_msg}")
-                results.append({
-                    'exam_code': exam_code,
-                    'status': 'failed',
-                    'question_count': 0,
-                    'error': error_msg
-                })
-                failed += 1
-        
-        # Mise à jour de la barre principale pour cet examen terminé
-        progress_manager.update_main(f"Exam {exam_code} completed: {len(links)} questions")
-        
-        # Respectful pause between exams
-        if i < len(exam_codes) - 1:
-            time.sleep(15)
+                try:
+                    # Créer un adaptateur pour maintenir la compatibilité avec scrape_questions
+                    legacy_adapter = LegacyProgressAdapter(progress_manager)
+                    
+                    # Utiliser le scraper existant pour les questions
+                    questions_obj = scrape_questions(
+                        links, 
+                        questions_path, 
+                        legacy_adapter, 
+                        rapid_scraping=False,  # Mode respectueux
+                        force_update=force_update,
+                        workers=question_workers
+                    )
+                    
+                    result = report_exam_questions(exam_code, questions_obj)
+                    results.append(result)
+                    successful += 1
+                    total_questions_processed += result['question_count']
+                    
+                except Exception as e:
+                    error_msg = str(e)
+                    progress_manager.update_sub(f"❌ {exam_code}: Exception - {error_msg}")
+                    results.append(failed_exam_result(exam_code, error_msg))
+                    failed += 1
+            
+            # Mise à jour de la barre principale pour cet examen terminé
+            progress_manager.update_main(f"Exam {exam_code} completed: {len(links)} questions")
     
     # Calculate global update statistics
     total_new = sum(result.get('update_stats', {}).get('new_count', 0) for result in results)
@@ -586,21 +1019,42 @@ def process_servicenow_questions_with_progress(exam_codes, progress_manager, for
     
     return results
 
+def use_line_buffered_stdout():
+    """
+    Writes stdout line by line when it isn't a terminal (CI logs), in UTF-8
+    Python would otherwise block-buffer it: progress of a long scrape would
+    show up late in the job log, and be lost if the job is killed
+    """
+    if sys.stdout.isatty():
+        return
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
+
 def main():
     """Main function for optimized ServiceNow scraper"""
     import argparse
     
+    use_line_buffered_stdout()
+    
     parser = argparse.ArgumentParser(description='Optimized batch scraper for ServiceNow')
     parser.add_argument('--links-only', action='store_true', 
                         help='Link collection only')
     parser.add_argument('--questions-only', action='store_true',
                         help='Question processing only (uses existing links)')
     parser.add_argument('--force-update', action='store_true',
-                        help='Force update of existing questions')
+                        help='Force update of existing questions and a full pass over the listing pages')
     parser.add_argument('--exam', type=str,
                         help='Process only a specific exam')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Number of listing pages fetched in parallel (default: 1, serial)')
+    parser.add_argument('--exam-workers', type=int, default=1,
+                        help='Number of exams whose questions are scraped in parallel (default: 1, sequential)')
+    parser.add_argument('--question-workers', type=int, default=1,
+                        help='Number of question pages fetched in parallel within an exam (default: 1, serial)')
+    parser.add_argument('--max-rate', type=float, default=RATE_LIMITER.rate,
+                        help=f'Maximum requests per second to ExamTopics (default: {RATE_LIMITER.rate})')
     
     args = parser.parse_args()
+    RATE_LIMITER.rate = args.max_rate
     
     print("🚀 Optimized ServiceNow Batch Scraper")
     print(f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -624,7 +1078,8 @@ def main():
                 return 1
         
         # Initialiser le gestionnaire de progression
-        progress_manager = ProgressManager("ServiceNow Batch Scraper")
+        # No fixed pause between exams anymore, requests are rate limited instead
+        progress_manager = ProgressManager("ServiceNow Batch Scraper", delay_stats={'exam_pause': 0.0})
         
         # Calculer le nombre total d'étapes
         if args.questions_only:
@@ -649,13 +1104,14 @@ def main():
                 # Traitement des questions uniquement
                 print("📝 Mode: Questions only (pre-existing links)")
                 results = process_servicenow_questions_with_progress(
-                    target_exam_codes, progress_manager, args.force_update
+                    target_exam_codes, progress_manager, args.force_update, args.exam_workers,
+                    args.question_workers
                 )
                 
             else:
                 # Phase 1: Collecte des liens
                 exam_links, total_pages = batch_collect_servicenow_links_with_progress(
-                    target_exam_codes, progress_manager
+                    target_exam_codes, progress_manager, args.concurrency, args.force_update
                 )
                 progress_manager.update_main("Phase 1: Link collection completed")
                 
@@ -672,20 +1128,23 @@ def main():
                 if not args.links_only:
                     # Phase 3: Traitement des questions
                     results = process_servicenow_questions_with_progress(
-                        target_exam_codes, progress_manager, args.force_update
+                        target_exam_codes, progress_manager, args.force_update, args.exam_workers,
+                        args.question_workers
                     )
             
             # Update manifest if processing questions
             if not args.links_only:
                 with progress_manager.sub_progress(len(target_exam_codes), "Updating manifest"):
                     try:
-                        from update_manifest import update_single_exam_in_manifest
+                        from update_manifest import update_many_exams_in_manifest
                         
                         updated_count = 0
                         failed_count = 0
                         
+                        # One manifest load and save for all exams
+                        manifest_results = update_many_exams_in_manifest(target_exam_codes)
                         for exam_code in target_exam_codes:
-                            if update_single_exam_in_manifest(exam_code):
+                            if manifest_results[exam_code]:
                                 updated_count += 1
                                 progress_manager.update_sub(f"✅ Updated {exam_code}")
                             else:
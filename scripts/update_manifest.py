@@ -28,13 +28,56 @@ import os
 import json
 import sys
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    # Faster JSON decoding and encoding when installed
+    import orjson
+except ImportError:
+    orjson = None
+
 def get_project_root():
     """Get the project root directory (one level up from scripts)"""
     return Path(__file__).parent.parent
 
-def scan_exam_directory(exam_path):
+# exam.json scan results of the previous run, kept next to the scripts and out
+# of the deployed public/data tree (only local runs find one)
+SCAN_CACHE_PATH = Path(__file__).parent / ".manifest_cache.json"
+
+def loads_json(data):
+    """Decode JSON bytes, with orjson when installed (every JSON file is read in binary mode for it)"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def load_scan_cache():
+    """
+    Load the exam.json scan results saved by the previous run
+    
+    Returns:
+        dict: {exam_code: {'mtime_ns', 'size', 'questionCount', 'name', 'lastUpdated', and the
+            'links_mtime_ns', 'links_size', 'source' of links.json}}, empty if unreadable
+    """
+    try:
+        with open(SCAN_CACHE_PATH, 'rb') as f:
+            scan_cache = loads_json(f.read())
+    except (OSError, ValueError):
+        return {}
+    return scan_cache if isinstance(scan_cache, dict) else {}
+
+def save_scan_cache(scan_cache):
+    """
+    Save the exam.json scan results for the next run (failures only print a warning)
+    
+    Args:
+        scan_cache (dict): Scan results by exam code
+    """
+    try:
+        with open(SCAN_CACHE_PATH, 'wb') as f:
+            f.write(orjson.dumps(scan_cache) if orjson is not None else json.dumps(scan_cache).encode('utf-8'))
+    except OSError as e:
+        print(f"⚠️  Could not save scan cache: {str(e)}")
+
+def scan_exam_directory(exam_path, scan_cache=None):
     """
     Scan an individual exam directory and extract metadata
     
@@ -43,57 +86,90 @@ def scan_exam_directory(exam_path):
     It's designed for performance - only reading what's necessary for the manifest.
     
     Args:
-        exam_path (Path): Path to the exam directory
+        exam_path (Path or os.DirEntry): Path to the exam directory
+        scan_cache (dict): Previous scan results, reused while exam.json and
+            links.json keep the same mtime and size, and updated with this scan
         
     Returns:
         dict: Exam metadata with keys: code, name, description, questionCount, lastUpdated
         None: If directory is invalid or contains no questions
     """
     exam_code = exam_path.name
-    exam_json_path = exam_path / "exam.json"
-    links_json_path = exam_path / "links.json"
+    exam_json_path = os.path.join(exam_path, "exam.json")
+    links_json_path = os.path.join(exam_path, "links.json")
     
-    # Check if required files exist
-    if not exam_json_path.exists():
+    # Check if required files exist (a single stat, all an unchanged exam needs)
+    try:
+        exam_stat = os.stat(exam_json_path)
+    except FileNotFoundError:
         print(f"⚠️  Skipping {exam_code}: exam.json not found")
         return None
         
     try:
-        # Load exam data
-        with open(exam_json_path, 'r', encoding='utf-8') as f:
-            exam_data = json.load(f)
+        cached = scan_cache.get(exam_code) if scan_cache is not None else None
+        if (cached and cached.get('mtime_ns') == exam_stat.st_mtime_ns
+                and cached.get('size') == exam_stat.st_size):
+            # exam.json unchanged since the last scan, no need to open it
+            question_count = cached['questionCount']
+            exam_name = cached['name']
+            last_updated = cached.get('lastUpdated') or datetime.fromtimestamp(exam_stat.st_mtime).isoformat()
+        else:
+            # Load exam data
+            with open(exam_json_path, 'rb') as f:
+                exam_data = loads_json(f.read())
+            
+            # Extract basic information
+            questions = exam_data.get('questions', [])
+            question_count = len(questions)
+            exam_name = exam_data.get('exam_name', exam_code)
+            last_updated = datetime.fromtimestamp(exam_stat.st_mtime).isoformat()
             
-        # Extract basic information
-        questions = exam_data.get('questions', [])
-        question_count = len(questions)
+            if scan_cache is not None:
+                scan_cache[exam_code] = {
+                    'mtime_ns': exam_stat.st_mtime_ns,
+                    'size': exam_stat.st_size,
+                    'questionCount': question_count,
+                    'name': exam_name,
+                    'lastUpdated': last_updated
+                }
         
         if question_count == 0:
             print(f"⚠️  {exam_code}: No questions found")
             return None
             
-        # Get file modification time
-        last_modified = exam_json_path.stat().st_mtime
-        last_updated = datetime.fromtimestamp(last_modified).isoformat()
-        
         # Extract exam name (try multiple sources)
-        exam_name = exam_data.get('exam_name', exam_code)
         if not exam_name or exam_name == exam_code:
             # Try to extract from first question or use code
             exam_name = exam_code
             
         # Get source information from links.json if available
         source_info = None
-        if links_json_path.exists():
-            try:
-                with open(links_json_path, 'r', encoding='utf-8') as f:
-                    links_data = json.load(f)
-                    source_info = {
-                        'total_links': len(links_data.get('links', [])),
-                        'scraped_links': len([l for l in links_data.get('links', []) if l.get('scraped', False)]),
-                        'last_scan': links_data.get('last_updated', 'unknown')
-                    }
-            except:
-                pass
+        try:
+            links_stat = os.stat(links_json_path)
+        except OSError:
+            links_stat = None
+        if links_stat is not None:
+            if (cached and cached.get('links_mtime_ns') == links_stat.st_mtime_ns
+                    and cached.get('links_size') == links_stat.st_size):
+                # links.json unchanged since the last scan, reuse its summary
+                source_info = cached.get('source')
+            else:
+                try:
+                    with open(links_json_path, 'rb') as f:
+                        links_data = loads_json(f.read())
+                        source_info = {
+                            'total_links': len(links_data.get('links', [])),
+                            'scraped_links': len([l for l in links_data.get('links', []) if l.get('scraped', False)]),
+                            'last_scan': links_data.get('last_updated', 'unknown')
+                        }
+                except:
+                    pass
+            if scan_cache is not None:
+                scan_cache[exam_code].update({
+                    'links_mtime_ns': links_stat.st_mtime_ns,
+                    'links_size': links_stat.st_size,
+                    'source': source_info
+                })
                 
         # Create manifest entry
         manifest_entry = {
@@ -125,6 +201,22 @@ def update_single_exam_in_manifest(exam_code):
     Returns:
         bool: Success status
     """
+    return update_many_exams_in_manifest([exam_code])[exam_code]
+
+
+def update_many_exams_in_manifest(exam_codes):
+    """
+    Update several exams in the manifest, preserving existing data
+    
+    The manifest is loaded and saved once for all exams, instead of once
+    per exam with update_single_exam_in_manifest.
+    
+    Args:
+        exam_codes (list): The exam codes to update
+        
+    Returns:
+        dict: Success status per exam code
+    """
     project_root = get_project_root()
     manifest_path = project_root / "public" / "data" / "manifest.json"
     
@@ -134,66 +226,152 @@ def update_single_exam_in_manifest(exam_code):
         print("📝 Creating new manifest with complete scan...")
         # If no manifest exists, generate a complete one
         manifest = generate_manifest()
-        return save_manifest(manifest) if manifest else False
+        saved = save_manifest(manifest) if manifest else False
+        return {exam_code: saved for exam_code in exam_codes}
     
     try:
         # Load existing manifest
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        with open(manifest_path, 'rb') as f:
+            manifest = loads_json(f.read())
     except Exception as e:
         print(f"❌ Error loading manifest: {str(e)}")
-        return False
+        return {exam_code: False for exam_code in exam_codes}
     
-    # Get updated exam data
-    exam_path = project_root / "public" / "data" / exam_code
-    if not exam_path.exists():
-        print(f"❌ Exam directory not found: {exam_path}")
-        return False
+    # Top level and exam list as loaded, the entries themselves are replaced, not modified
+    previous = {**manifest, 'exams': list(manifest.get('exams', []))}
+    scan_cache = load_scan_cache()
+    # Position of each exam in the list, instead of a search per update
+    exam_index = {exam.get('code'): i for i, exam in enumerate(manifest.get('exams', []))}
+    results = {}
+    exams_added = False
+    question_delta = 0
+    for exam_code in exam_codes:
+        # Get updated exam data
+        exam_path = project_root / "public" / "data" / exam_code
+        if not exam_path.exists():
+            print(f"❌ Exam directory not found: {exam_path}")
+            results[exam_code] = False
+            continue
+        
+        updated_entry = scan_exam_directory(exam_path, scan_cache)
+        if not updated_entry:
+            print(f"❌ Failed to scan exam directory: {exam_code}")
+            results[exam_code] = False
+            continue
+        
+        previous_entry = merge_exam_entry(manifest, updated_entry, exam_index)
+        if previous_entry is None:
+            exams_added = True
+            question_delta += updated_entry['questionCount']
+        else:
+            question_delta += updated_entry['questionCount'] - previous_entry.get('questionCount', 0)
+        results[exam_code] = True
     
-    updated_entry = scan_exam_directory(exam_path)
-    if not updated_entry:
-        print(f"❌ Failed to scan exam directory: {exam_code}")
-        return False
+    save_scan_cache(scan_cache)
     
-    # Find and update the exam in the manifest
-    exam_found = False
-    for i, exam in enumerate(manifest.get('exams', [])):
-        if exam.get('code') == exam_code:
-            # Preserve existing description if it exists and is different from auto-generated
-            existing_description = exam.get('description', '')
-            auto_generated_description = f"{updated_entry['name']} certification exam questions"
-            
-            # Only preserve description if it's not the auto-generated one
-            if existing_description and existing_description != auto_generated_description:
-                print(f"📝 Preserving custom description for {exam_code}")
-                updated_entry['description'] = existing_description
-            
-            # Update the exam entry
-            manifest['exams'][i] = updated_entry
-            exam_found = True
-            print(f"✅ Updated {exam_code} in manifest (questions: {updated_entry['questionCount']})")
-            break
-    
-    if not exam_found:
-        # Add new exam to manifest
-        manifest.setdefault('exams', []).append(updated_entry)
+    if not any(results.values()):
+        return results
+    
+    if exams_added:
         # Sort exams by code
-        manifest['exams'].sort(key=lambda x: x['code'])
-        print(f"✅ Added {exam_code} to manifest (questions: {updated_entry['questionCount']})")
+        manifest['exams'].sort(key=itemgetter('code'))
     
     # Update manifest metadata (but keep other exams' lastUpdated unchanged)
     manifest['generated'] = datetime.now().isoformat()
     manifest['totalExams'] = len(manifest.get('exams', []))
-    manifest['totalQuestions'] = sum(exam['questionCount'] for exam in manifest.get('exams', []))
+    if 'totalQuestions' in manifest:
+        # Only the updated exams changed the total
+        manifest['totalQuestions'] += question_delta
+    else:
+        manifest['totalQuestions'] = sum(exam['questionCount'] for exam in manifest.get('exams', []))
     
     # Save the updated manifest
-    return save_manifest(manifest)
+    if not save_manifest(manifest, previous):
+        return {exam_code: False for exam_code in results}
+    return results
+
+
+def merge_exam_entry(manifest, updated_entry, exam_index=None):
+    """
+    Replace or add an exam entry in a loaded manifest
+    
+    Args:
+        manifest (dict): The manifest data, modified in place
+        updated_entry (dict): Freshly scanned exam entry
+        exam_index (dict): Position of each exam code in manifest['exams'],
+            kept up to date when the exam is added (built here if omitted)
+        
+    Returns:
+        dict: The replaced entry, None if the exam was added
+    """
+    exam_code = updated_entry['code']
+    exams = manifest.setdefault('exams', [])
+    if exam_index is None:
+        exam_index = {exam.get('code'): i for i, exam in enumerate(exams)}
+    
+    # Find and update the exam in the manifest
+    i = exam_index.get(exam_code)
+    if i is not None:
+        exam = exams[i]
+        preserve_custom_description(exam, updated_entry)
+        
+        # Update the exam entry
+        exams[i] = updated_entry
+        print(f"✅ Updated {exam_code} in manifest (questions: {updated_entry['questionCount']})")
+        return exam
+    
+    # Add new exam to manifest
+    exam_index[exam_code] = len(exams)
+    exams.append(updated_entry)
+    print(f"✅ Added {exam_code} to manifest (questions: {updated_entry['questionCount']})")
+    return None
+
+
+def preserve_custom_description(existing_entry, updated_entry):
+    """
+    Keep the existing description of an exam if it was written by hand
+    
+    Args:
+        existing_entry (dict): The exam entry currently in the manifest
+        updated_entry (dict): Freshly scanned exam entry, modified in place
+    """
+    # Preserve existing description if it exists and is different from auto-generated
+    existing_description = existing_entry.get('description', '')
+    auto_generated_description = f"{updated_entry['name']} certification exam questions"
+    
+    # Only preserve description if it's not the auto-generated one
+    if existing_description and existing_description != auto_generated_description:
+        print(f"📝 Preserving custom description for {updated_entry['code']}")
+        updated_entry['description'] = existing_description
+
+
+def load_existing_manifest(manifest_path):
+    """
+    Load the current manifest, decoded once and shared by the scan and the save
+    
+    Args:
+        manifest_path (Path): Path to manifest.json
+        
+    Returns:
+        dict: The manifest data, None if there is no readable manifest
+    """
+    try:
+        with open(manifest_path, 'rb') as f:
+            manifest = loads_json(f.read())
+    except Exception:
+        return None
+    return manifest if isinstance(manifest, dict) else None
 
 
-def generate_manifest():
+def generate_manifest(generated_at=None, previous=None):
     """
     Generate the complete manifest.json file
     
+    Args:
+        generated_at (datetime): Run timestamp for the manifest, now if omitted
+        previous (dict): The manifest currently on disk, whose custom
+            descriptions are kept
+        
     Returns:
         dict: Generated manifest data
     """
@@ -208,24 +386,36 @@ def generate_manifest():
     
     manifest_entries = []
     skipped_dirs = []
+    scan_cache = load_scan_cache()
+    scanned_dirs = set()
+    # Current entries, looked up as each exam is scanned to keep custom descriptions
+    existing_exams = {exam.get('code'): exam for exam in (previous or {}).get('exams', [])}
     
-    # Scan all directories in data folder
-    for item in data_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            entry = scan_exam_directory(item)
-            if entry:
-                manifest_entries.append(entry)
-                print(f"✅ {entry['code']}: {entry['questionCount']} questions")
-            else:
-                skipped_dirs.append(item.name)
+    # Scan all directories in data folder (scandir entries cache their file type)
+    with os.scandir(data_dir) as items:
+        for item in items:
+            if item.is_dir() and not item.name.startswith('.'):
+                scanned_dirs.add(item.name)
+                entry = scan_exam_directory(item, scan_cache)
+                if entry:
+                    existing_entry = existing_exams.get(entry['code'])
+                    if existing_entry:
+                        preserve_custom_description(existing_entry, entry)
+                    manifest_entries.append(entry)
+                    print(f"✅ {entry['code']}: {entry['questionCount']} questions")
+                else:
+                    skipped_dirs.append(item.name)
+    
+    # Forget exams whose directory is gone
+    save_scan_cache({code: cached for code, cached in scan_cache.items() if code in scanned_dirs})
                 
     # Sort entries by exam code
-    manifest_entries.sort(key=lambda x: x['code'])
+    manifest_entries.sort(key=itemgetter('code'))
     
     # Create manifest structure
     manifest = {
         'version': '3.0',
-        'generated': datetime.now().isoformat(),
+        'generated': (generated_at or datetime.now()).isoformat(),
         'totalExams': len(manifest_entries),
         'totalQuestions': sum(entry['questionCount'] for entry in manifest_entries),
         'exams': manifest_entries
@@ -241,12 +431,34 @@ def generate_manifest():
     return manifest
 
 
-def save_manifest(manifest):
+def manifest_unchanged(previous, manifest):
+    """
+    Check whether the manifest on disk already has the same content
+    
+    Args:
+        previous (dict): The manifest currently on disk, as loaded by the caller
+        manifest (dict): The manifest data to save
+        
+    Returns:
+        bool: True if only the 'generated' timestamp would change
+    """
+    if not previous or previous.keys() != manifest.keys():
+        return False
+    return all(key == 'generated' or previous[key] == value for key, value in manifest.items())
+
+
+def save_manifest(manifest, previous=None):
     """
     Save the manifest to disk
     
+    The file (and its backup) is left untouched when only the generation
+    timestamp would change from previous, keeping its mtime and avoiding
+    empty git diffs. The file is not read again for that check.
+    
     Args:
         manifest (dict): The manifest data to save
+        previous (dict): The manifest currently on disk, already loaded by the
+            caller (None to always write)
         
     Returns:
         bool: Success status
@@ -257,24 +469,47 @@ def save_manifest(manifest):
     project_root = get_project_root()
     manifest_path = project_root / "public" / "data" / "manifest.json"
     
+    if manifest_unchanged(previous, manifest):
+        print(f"✅ Manifest unchanged: {manifest_path}")
+        return True
+    
+    tmp_path = project_root / "public" / "data" / "manifest.json.tmp"
+    
     try:
+        # Write new manifest to a temporary file, readers keep the old one meanwhile
+        if orjson is not None:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            
         # Create backup of existing manifest
         if manifest_path.exists():
             backup_path = project_root / "public" / "data" / "manifest.json.backup"
-            # Copy instead of rename to preserve original
-            import shutil
-            shutil.copy2(manifest_path, backup_path)
+            # Hardlink instead of copying, the manifest is replaced below, never rewritten in place
+            try:
+                os.unlink(backup_path)
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(manifest_path, backup_path)
+            except OSError:
+                # Filesystem without hardlinks
+                import shutil
+                shutil.copy2(manifest_path, backup_path)
             print(f"💾 Backup created: manifest.json.backup")
             
-        # Write new manifest
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        # Atomic switch to the new manifest
+        os.replace(tmp_path, manifest_path)
             
         print(f"✅ Manifest saved: {manifest_path}")
         return True
         
     except Exception as e:
         print(f"❌ Error saving manifest: {str(e)}")
+        if tmp_path.exists():
+            tmp_path.unlink()
         return False
 
 def validate_manifest(manifest):
@@ -307,11 +542,14 @@ def validate_manifest(manifest):
 
 def main():
     """Main function"""
+    # One timestamp for the whole run
+    started_at = datetime.now()
     print("🚀 Starting manifest generation")
-    print(f"⏰ Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"⏰ Timestamp: {started_at.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Generate manifest
-    manifest = generate_manifest()
+    # Generate manifest (the current one is decoded once, for descriptions and the save)
+    previous = load_existing_manifest(get_project_root() / "public" / "data" / "manifest.json")
+    manifest = generate_manifest(started_at, previous)
     
     if not manifest:
         print("❌ Failed to generate manifest")
@@ -323,7 +561,7 @@ def main():
         sys.exit(1)
         
     # Save manifest
-    if not save_manifest(manifest):
+    if not save_manifest(manifest, previous):
         print("❌ Failed to save manifest")
         sys.exit(1)
         